@@ -15,6 +15,9 @@ interface GameProps {
   onGameCreated: (gameId: string) => void;
 }
 
+const MAX_RESUME_ATTEMPTS = 5;
+const RESUME_BACKOFF_MS = 500;
+
 export function Game({ playerName, gameId, specs, serverUrl, onExit, onError, onGameCreated }: GameProps) {
   const [status, setStatus] = useState<string>('Connecting...');
   const clientRef = useRef<PongClient | null>(null);
@@ -22,6 +25,10 @@ export function Game({ playerName, gameId, specs, serverUrl, onExit, onError, on
   const gameStateRef = useRef<GameState | null>(null);
   const p5InstanceRef = useRef<p5 | null>(null);
   const keysPressed = useRef<Set<string>>(new Set());
+  const [server, setServer] = useState(serverUrl);
+  const [connectionAttempt, setConnectionAttempt] = useState(0);
+  const resumeTokenRef = useRef<string | null>(null);
+  const resumeAttemptsRef = useRef(0);
 
   const calculateCanvasSize = useCallback(() => {
     if (!containerRef.current) return { width: 0, height: 0 };
@@ -65,8 +72,9 @@ export function Game({ playerName, gameId, specs, serverUrl, onExit, onError, on
   // WebSocket connection
   useEffect(() => {
     let isSubscribed = true;
+    let migrating = false;
 
-    const client = new PongClient(serverUrl, gameId, playerName);
+    const client = new PongClient(server, gameId, playerName, resumeTokenRef.current);
     clientRef.current = client;
 
     client.onConnect = () => {
@@ -74,13 +82,42 @@ export function Game({ playerName, gameId, specs, serverUrl, onExit, onError, on
       setStatus('Connected');
     };
 
+    client.onSession = (resumeToken) => {
+      if (!isSubscribed) return;
+      resumeTokenRef.current = resumeToken;
+    };
+
+    client.onCatchUp = ({ state, delayMs }) => {
+      if (!isSubscribed) return;
+      resumeAttemptsRef.current = 0;
+      if (state === 'paused') {
+        handleGameStatus('game_paused');
+      } else if (state === 'waiting') {
+        handleGameStatus('waiting_for_players');
+      } else if (state === 'playing') {
+        setStatus(delayMs > 0 ? `Resuming in ${Math.ceil(delayMs / 1000)}...` : 'Game in progress');
+      }
+    };
+
     client.onConnectError = (error) => {
       if (!isSubscribed) return;
+      resumeTokenRef.current = null;
       onError(error);
     };
 
     client.onDisconnect = () => {
-      if (!isSubscribed) return;
+      if (!isSubscribed || migrating) return;
+      if (resumeTokenRef.current && resumeAttemptsRef.current < MAX_RESUME_ATTEMPTS) {
+        // Resume in place with jittered backoff, so a network blip does not reconnect every client at once
+        resumeAttemptsRef.current += 1;
+        const delayMs = RESUME_BACKOFF_MS * resumeAttemptsRef.current * (0.5 + Math.random());
+        setStatus('Connection lost - resuming...');
+        setTimeout(() => {
+          if (!isSubscribed) return;
+          setConnectionAttempt((attempt) => attempt + 1);
+        }, delayMs);
+        return;
+      }
       setStatus('Disconnected');
       onError('Connection lost');
     };
@@ -100,12 +137,26 @@ export function Game({ playerName, gameId, specs, serverUrl, onExit, onError, on
       gameStateRef.current = state;
     };
 
+    client.onReconnect = (newServer, delayMs) => {
+      if (!isSubscribed) return;
+      migrating = true;
+      // The room moves to another instance, join it by id instead of resuming a seat that stays behind
+      resumeTokenRef.current = null;
+      resumeAttemptsRef.current = 0;
+      setStatus('Server restarting - reconnecting...');
+      setTimeout(() => {
+        if (!isSubscribed) return;
+        setServer(newServer ?? serverUrl);
+        setConnectionAttempt((attempt) => attempt + 1);
+      }, delayMs);
+    };
+
     return () => {
       isSubscribed = false;
       client.close();
       clientRef.current = null;
     };
-  }, [serverUrl, gameId, playerName, onError, onGameCreated, handleGameStatus]);
+  }, [server, serverUrl, connectionAttempt, gameId, playerName, onError, onGameCreated, handleGameStatus]);
 
   // p5.js setup and game rendering
   useEffect(() => {
@@ -235,16 +286,17 @@ export function Game({ playerName, gameId, specs, serverUrl, onExit, onError, on
           paddleHeight
         );
       
-        // Draw ball - only if game state exists or use initial position
+        // Draw balls - only if game state exists or use initial position
         const ballSize = p.width * specs.ball.radius * 2;
-        const ballX = state ? state.ball.x : specs.ball.initial.x;
-        const ballY = state ? state.ball.y : specs.ball.initial.y;
-        p.ellipse(
-          ballX * scaleX,
-          ballY * scaleY,
-          ballSize,
-          ballSize
-        );
+        const balls = state ? state.balls : [specs.ball.initial];
+        for (const ball of balls) {
+          p.ellipse(
+            ball.x * scaleX,
+            ball.y * scaleY,
+            ballSize,
+            ballSize
+          );
+        }
       
         // Draw score - only if game state exists
         if (state) {
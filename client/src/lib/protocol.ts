@@ -13,6 +13,7 @@ export interface GameState {
     x: number;
     y: number;
   };
+  balls: { x: number; y: number; }[];
   paddles: {
     left: number;
     right: number;
@@ -24,6 +25,12 @@ export interface GameState {
   winner: 'left' | 'right' | null;
 }
 
+export interface CatchUp {
+  state: 'waiting' | 'playing' | 'paused' | 'game_over';
+  playerCount: number;
+  delayMs: number;
+}
+
 export interface GameSpecs {
   ball: {
     radius: number;
@@ -53,17 +60,23 @@ export class PongClient {
   onGameState?: (state: GameState) => void;
   onGameStatus?: (status: string) => void;
   onGameId?: (gameId: string) => void;
+  onReconnect?: (server: string | null, delayMs: number) => void;
+  onSession?: (resumeToken: string) => void;
+  onCatchUp?: (catchUp: CatchUp) => void;
   onConnect?: () => void;
   onConnectError?: (error: string) => void;
   onDisconnect?: () => void;
 
-  constructor(server: string, roomId: string | null, playerName: string) {
+  constructor(server: string, roomId: string | null, playerName: string, resumeToken: string | null = null) {
     const params = new URLSearchParams();
     params.append('player_name', playerName);
     params.append('player_uuid', getPlayerUUID());
     if (roomId) {
         params.append('room_id', roomId);
     }
+    if (resumeToken) {
+        params.append('resume', resumeToken);
+    }
 
     const { ws: protocol } = getProtocols(server);
     const wsUrl = `${protocol}://${server}/game?${params.toString()}`;
@@ -88,39 +101,109 @@ export class PongClient {
         } else if (event.reason === "Room is full") {
           this.onConnectError?.('Game is full');
         }
+      } else if (event.code === 1008) {
+        this.onConnectError?.('Session expired');
+      } else if (event.code === 1013) {
+        this.onConnectError?.('Server is busy, please try again shortly');
       }
       this.onDisconnect?.();
     };
 
     this.ws.onmessage = (event) => {
-      const data = new DataView(event.data);
-      const messageType = data.getUint8(0);
-
-      switch (messageType) {
-        case 0x01: // Game State
-          this.handleGameState(data);
-          break;
-        case 0x02: // Game Status
-          this.handleGameStatus(data);
-          break;
-        case 0x03: // Game ID
-          this.handleGameId(data);
-          break;
-      }
+      this.handleMessage(new DataView(event.data));
     };
   }
 
+  private handleMessage(data: DataView) {
+    const messageType = data.getUint8(0);
+
+    switch (messageType) {
+      case 0x01: // Game State
+        this.handleGameState(data);
+        break;
+      case 0x02: // Game Status
+        this.handleGameStatus(data);
+        break;
+      case 0x03: // Game ID
+        this.handleGameId(data);
+        break;
+      case 0x04: // Reconnect
+        this.handleReconnect(data);
+        break;
+      case 0x05: // Ping
+        this.handlePing(data);
+        break;
+      case 0x06: // Batch
+        this.handleBatch(data);
+        break;
+      case 0x07: // Game Update, informational only
+        break;
+      case 0x08: // Multi-ball Game State
+        this.handleMultiBallState(data);
+        break;
+      case 0x09: // Session
+        this.handleSession(data);
+        break;
+      case 0x0A: // Catch-up
+        this.handleCatchUp(data);
+        break;
+    }
+  }
+
+  private handleBatch(data: DataView) {
+    const count = data.getUint8(1);
+    let offset = 2;
+    for (let i = 0; i < count; i++) {
+      const length = data.getUint16(offset, false);
+      this.handleMessage(new DataView(data.buffer, data.byteOffset + offset + 2, length));
+      offset += 2 + length;
+    }
+  }
+
+  private handleSession(data: DataView) {
+    const length = data.getUint8(1);
+    const decoder = new TextDecoder();
+    this.onSession?.(decoder.decode(new Uint8Array(data.buffer, data.byteOffset + 2, length)));
+  }
+
+  private handleCatchUp(data: DataView) {
+    const states = ['waiting', 'playing', 'paused', 'game_over'] as const;
+    this.onCatchUp?.({
+      state: states[data.getUint8(1)],
+      playerCount: data.getUint8(2),
+      delayMs: data.getUint16(6, false)
+    });
+    // The current game state message follows the header
+    this.handleMessage(new DataView(data.buffer, data.byteOffset + 8, data.byteLength - 8));
+  }
+
   private handleGameId(data: DataView) {
     const length = data.getUint8(1);
     const decoder = new TextDecoder();
-    const gameId = decoder.decode(new Uint8Array(data.buffer, 2, length));
+    const gameId = decoder.decode(new Uint8Array(data.buffer, data.byteOffset + 2, length));
     this.onGameId?.(gameId);
   }
 
+  private handlePing(data: DataView) {
+    if (this.ws.readyState !== WebSocket.OPEN) return;
+    const heartbeat = new DataView(new ArrayBuffer(5));
+    heartbeat.setUint8(0, 0x00);
+    heartbeat.setUint32(1, data.getUint32(1, false), false);
+    this.ws.send(heartbeat.buffer);
+  }
+
+  private handleReconnect(data: DataView) {
+    const delayMs = data.getUint16(1, false);
+    const length = data.getUint8(3);
+    const decoder = new TextDecoder();
+    const server = decoder.decode(new Uint8Array(data.buffer, data.byteOffset + 4, length));
+    this.onReconnect?.(server || null, delayMs);
+  }
+
   private handleGameStatus(data: DataView) {
     const length = data.getUint8(1);
     const decoder = new TextDecoder();
-    const status = decoder.decode(new Uint8Array(data.buffer, 2, length));
+    const status = decoder.decode(new Uint8Array(data.buffer, data.byteOffset + 2, length));
     
     // Check if game is over
     if (status.startsWith('game_over')) {
@@ -135,11 +218,13 @@ export class PongClient {
   }
 
   private handleGameState(data: DataView) {
+    const ball = {
+      x: data.getFloat32(1, false),
+      y: data.getFloat32(5, false)
+    };
     const gameState: GameState = {
-      ball: {
-        x: data.getFloat32(1, false),
-        y: data.getFloat32(5, false)
-      },
+      ball,
+      balls: [ball],
       paddles: {
         left: data.getFloat32(9, false),
         right: data.getFloat32(13, false)
@@ -160,6 +245,31 @@ export class PongClient {
     this.onGameState?.(gameState);
   }
 
+  private handleMultiBallState(data: DataView) {
+    const count = data.getUint8(12);
+    const balls = [];
+    for (let i = 0; i < count; i++) {
+      balls.push({
+        x: data.getFloat32(13 + i * 8, false),
+        y: data.getFloat32(17 + i * 8, false)
+      });
+    }
+    const winnerCode = data.getUint8(11);
+    this.onGameState?.({
+      ball: balls[0] ?? { x: 0.5, y: 0.5 },
+      balls,
+      paddles: {
+        left: data.getFloat32(1, false),
+        right: data.getFloat32(5, false)
+      },
+      score: {
+        left: data.getUint8(9),
+        right: data.getUint8(10)
+      },
+      winner: winnerCode === 1 ? 'left' : winnerCode === 2 ? 'right' : null
+    });
+  }
+
   public sendPaddleUp() {
     if (this.ws.readyState === WebSocket.OPEN) {
       const command = new Uint8Array([0x01]);
@@ -1,10 +1,16 @@
-import numpy as np
-import matplotlib.pyplot as plt
+"""Local debug visualisation of the game simulation.
 
+Matplotlib is a development-only dependency, so it is imported lazily inside
+``show_animation`` and never pulled in by the server import path.
+"""
+from domain.enums import GameState
 from domain.game import Game
-from matplotlib.animation import FuncAnimation
+
 
 def show_animation(game: Game, dt):
+    import matplotlib.pyplot as plt
+    from matplotlib.animation import FuncAnimation
+
     fig, ax = plt.subplots()
 
     # Boundaries of the game board
@@ -44,12 +50,14 @@ def show_animation(game: Game, dt):
     # Show the plot
     plt.show()
 
-#other inputs
-dt = 1/120 # frames / second
 
-game = Game()
-game.player_count = 2
-game.state = Game.state.PLAYING
+if __name__ == "__main__":
+    #other inputs
+    dt = 1/120 # frames / second
+
+    game = Game()
+    game.player_count = 2
+    game.state = GameState.PLAYING
 
-# show the animation
-show_animation(game, dt)
\ No newline at end of file
+    # show the animation
+    show_animation(game, dt)
@@ -0,0 +1,101 @@
+import json
+import os
+import secrets
+import time
+from typing import Dict, List
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import Response
+
+from core import profiling
+from core.game_loop import game_loop
+from domain.fixed_point import FixedPointGame
+
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")  # Admin endpoints are disabled when unset
+MAX_CAPTURE_SECONDS = 60
+
+
+def require_admin(x_admin_token: str | None = Header(default=None)) -> None:
+    if not ADMIN_TOKEN or not x_admin_token or not secrets.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+
+admin = APIRouter(prefix="/admin", dependencies=[Depends(require_admin)])
+
+
+def artifact(content: bytes | str, filename: str, media_type: str = "application/octet-stream") -> Response:
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+async def exclusive_capture(capture, *args):
+    if profiling.capture_lock.locked():
+        raise HTTPException(status_code=409, detail="Another capture is running")
+    async with profiling.capture_lock:
+        return await capture(*args)
+
+
+@admin.get("/profile")
+async def profile(
+        seconds: float = Query(default=10, gt=0, le=MAX_CAPTURE_SECONDS),
+        mode: str = Query(default="cprofile", pattern="^(cprofile|sampling)$"),
+        output: str = Query(default="raw", pattern="^(raw|text)$"),
+) -> Response:
+    """Capture a time-boxed profile of the event loop thread running the game loop.
+
+    cprofile returns a pstats dump (or text summary), sampling returns collapsed stacks.
+    """
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    if mode == "sampling":
+        stacks = await exclusive_capture(profiling.capture_samples, seconds)
+        return artifact(stacks, f"pong-{stamp}.folded", "text/plain")
+
+    stats, summary = await exclusive_capture(profiling.capture_cprofile, seconds)
+    if output == "text":
+        return artifact(summary, f"pong-{stamp}.txt", "text/plain")
+    return artifact(stats, f"pong-{stamp}.pstats")
+
+
+@admin.get("/tracemalloc")
+async def trace_allocations(
+        seconds: float = Query(default=10, gt=0, le=MAX_CAPTURE_SECONDS),
+        output: str = Query(default="raw", pattern="^(raw|text)$"),
+) -> Response:
+    """Capture a tracemalloc snapshot after tracing allocations for a time box."""
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    snapshot, summary = await exclusive_capture(profiling.capture_tracemalloc, seconds)
+    if output == "text":
+        return artifact(summary, f"pong-{stamp}-alloc.txt", "text/plain")
+    return artifact(snapshot, f"pong-{stamp}.tracemalloc")
+
+
+@admin.get("/rooms/cost", response_model=None)
+def room_costs(download: bool = False) -> List[Dict] | Response:
+    """Cumulative CPU time per room spent in the simulation and in broadcasting, most expensive first."""
+    report = sorted(
+        (room.cost_report() for room in game_loop.rooms.values()),
+        key=lambda r: r["update_cpu_ms"] + r["broadcast_cpu_ms"],
+        reverse=True
+    )
+    if download:
+        return artifact(json.dumps(report, indent=2), f"pong-{time.strftime('%Y%m%d-%H%M%S')}-rooms.json",
+                        "application/json")
+    return report
+
+
+@admin.get("/rooms/{room_id}/replay")
+def room_replay(room_id: str) -> Dict:
+    """Seed, input log and exact state of a fixed-point room, to replay and verify it offline."""
+    room = game_loop.rooms.get(room_id)
+    if not room or not isinstance(room.game_state, FixedPointGame):
+        raise HTTPException(status_code=404, detail="No fixed-point room with this id")
+    game = room.game_state
+    return {
+        "seed": game.seed,
+        "steps": game.steps,
+        "inputs": [replay_input._asdict() for replay_input in game.inputs],
+        "state": game.pack().hex(),
+    }
@@ -1,11 +1,15 @@
+import asyncio
 import uuid
 from datetime import datetime
 from typing import Dict, List
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
+from core.capacity import RETRY_AFTER
 from core.game_loop import game_loop
+from core.results_store import results_store
 from domain.ball import Ball
 from domain.enums import GameState
 from domain.game import Game
@@ -31,7 +35,7 @@ async def get_games(_: Request) -> List[GameInfo]:
             active_games.append(GameInfo(
                 id=uuid.UUID(room.game_id),
                 state=room.game_state.state,
-                player_count=len([p for p in room.players.values() if p.connected]),
+                player_count=room.connected_count,
                 left_score=room.game_state.left_score,
                 right_score=room.game_state.right_score,
                 winner=room.game_state.winner,
@@ -77,7 +81,36 @@ def get_game_specs(_: Request) -> Dict:
 @endpoints.get("/health")
 def health_check(_: Request) -> Dict:
     """Health check endpoint to verify the server is running."""
+    if game_loop.draining:
+        return JSONResponse(status_code=503, content={
+            "status": "draining",
+            "service": "pong-server"
+        })
     return {
         "status": "healthy",
         "service": "pong-server"
-    }
\ No newline at end of file
+    }
+
+@endpoints.get("/ready")
+def readiness_check(_: Request) -> Dict:
+    """Readiness endpoint for load balancers, reports room headroom."""
+    report = game_loop.capacity.report()
+    if game_loop.draining or not game_loop.capacity.can_admit_room():
+        return JSONResponse(
+            status_code=503,
+            content={"status": "draining" if game_loop.draining else "at_capacity", **report},
+            headers={"Retry-After": str(RETRY_AFTER)}
+        )
+    return {"status": "ready", **report}
+
+
+@endpoints.get("/matches/recent")
+async def get_recent_matches(limit: int = Query(default=20, gt=0, le=100)) -> List[Dict]:
+    """Most recently finished matches from the results history."""
+    return await asyncio.to_thread(results_store.recent_matches, limit)
+
+
+@endpoints.get("/players/{player_uuid}/stats")
+async def get_player_stats(player_uuid: str) -> Dict:
+    """Aggregated results of a player over all recorded matches."""
+    return await asyncio.to_thread(results_store.player_stats, player_uuid)
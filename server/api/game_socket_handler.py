@@ -1,15 +1,27 @@
 import struct
+import time
 import uuid
+from typing import Optional, Tuple
 from fastapi import WebSocket, WebSocketDisconnect, HTTPException
 
-from core.game_room import GameRoom
+from core.bots import DEFAULT_DIFFICULTY, DIFFICULTIES
+from core.capacity import RETRY_AFTER
+from core.connection_registry import connection_registry
+from core.game_room import DEFAULT_PHYSICS, DEFAULT_ROOM_CLASS, PHYSICS_BACKENDS, TICK_RATES, GameRoom, Player
+from core.heartbeat import record_heartbeat
+from core.sessions import issue_resume_token, verify_resume_token
 from domain.enums import GameState
+from domain.game import Game
 from logger import logger
-from networking.binary_protocol import decode_command, CommandType, encode_game_id
+from networking.binary_protocol import (
+    decode_command, decode_heartbeat, CommandType, encode_batch, encode_game_id, encode_session
+)
 import asyncio
 
 
 CONNECTION_TIMEOUT = 60 * 5  # Connection timeout in seconds
+TRY_AGAIN_LATER_CODE = 1013  # WebSocket close code for temporary unavailability
+POLICY_VIOLATION_CODE = 1008
 
 ALLOWED_ORIGINS = [
     "http://localhost:5173",  # Vite dev server default port
@@ -22,10 +34,17 @@ async def handle_game_connection(
         player_name: str | None = None,
         room_id: str | None = None,
         player_uuid: str | None = None,
-        game_loop=None
+        game_loop=None,
+        opponent: str | None = None,
+        difficulty: str = DEFAULT_DIFFICULTY,
+        room_class: str = DEFAULT_ROOM_CLASS,
+        balls: int = 1,
+        physics: str = DEFAULT_PHYSICS,
+        resume: str | None = None
 ):
     if not player_uuid:
         await websocket.close(code=1003, reason="Player UUID required")
+        return
 
     room = None
     player_role = None
@@ -36,26 +55,14 @@ async def handle_game_connection(
             await websocket.close(code=1003, reason="Origin not allowed")
             return
 
-        if not player_name:
-            raise HTTPException(status_code=400, detail="Player name is required")
-
-        # Validate or create room
-        if not room_id:
-            room_id = str(uuid.uuid4())
-
-        # Get existing room or create new one
-        room = game_loop.rooms.get(room_id)
-        if not room:
-            room = GameRoom(room_id)
-            game_loop.add_room(room)
-
-        player_role = await room.connect(websocket, player_name, player_uuid)
-
-
-        if not player_role:
-            raise HTTPException(status_code=409, detail="Room is full")
-
-        await websocket.send_bytes(encode_game_id(room.game_id))
+        joined = await join_game(
+            websocket, player_name, room_id, player_uuid, game_loop, opponent, difficulty, room_class, balls, physics,
+            resume
+        )
+        if not joined:
+            return
+        room, player = joined
+        room_id, player_role = room.game_id, player.role
 
         while True:
             async with asyncio.timeout(CONNECTION_TIMEOUT):
@@ -65,38 +72,137 @@ async def handle_game_connection(
                     break
 
                 if message["type"] == "websocket.receive" and "bytes" in message:
+                    player.last_seen = time.monotonic()
                     try:
                         command = decode_command(message["bytes"])
 
+                        if command == CommandType.HEARTBEAT:
+                            record_heartbeat(player, decode_heartbeat(message["bytes"]))
+                            continue
+
                         if room.game_state.state != GameState.PLAYING:
                             continue
 
+                        paddle = room.game_state.left_paddle if player_role == "left" else room.game_state.right_paddle
                         if command == CommandType.PADDLE_UP:
-                            if player_role == "left":
-                                room.game_state.left_paddle.move_up()
-                            else:
-                                room.game_state.right_paddle.move_up()
+                            room.change_game(paddle.move_up)
                         elif command == CommandType.PADDLE_DOWN:
-                            if player_role == "left":
-                                room.game_state.left_paddle.move_down()
-                            else:
-                                room.game_state.right_paddle.move_down()
+                            room.change_game(paddle.move_down)
 
                     except (struct.error, Exception) as e:
-                        logger.error(f"Error processing command: {e}")
+                        logger.error("Error processing command: %s", e, extra={"room": room_id, "player": player_uuid})
                         continue
 
     except asyncio.TimeoutError:
-        logger.warning(f"Connection timeout for room {room_id}")
+        logger.warning("Connection timeout", extra={"room": room_id, "player": player_uuid})
         raise HTTPException(status_code=408, detail="Connection timeout")
     except WebSocketDisconnect:
-        logger.info(f"WebSocket disconnected for room {room_id}")
+        logger.info("WebSocket disconnected", extra={"room": room_id, "player": player_uuid})
+    except HTTPException as e:
+        # Rejected joins keep their status in the close reason, e.g. "400: Invalid room id"
+        logger.error("Error in websocket connection: %s", e.detail, extra={"room": room_id, "player": player_uuid})
+        raise
     except Exception as e:
-        logger.error(f"Error in websocket connection: {e}")
+        logger.error("Error in websocket connection: %s", e, extra={"room": room_id, "player": player_uuid})
         raise HTTPException(status_code=500, detail="Internal server error")
     finally:
         if room and player_role:
-            room.disconnect(websocket)
-            # Remove room if no players
-            if not room.players and game_loop:
-                game_loop.remove_room(room_id)
\ No newline at end of file
+            leave_game(websocket, room, game_loop)
+
+
+def is_room_id(room_id: str) -> bool:
+    """Room ids are canonical UUIDs, they end up in file names and game update messages."""
+    try:
+        return str(uuid.UUID(room_id)) == room_id
+    except ValueError:
+        return False
+
+
+async def join_game(
+        websocket: WebSocket,
+        player_name: str | None,
+        room_id: str | None,
+        player_uuid: str,
+        game_loop,
+        opponent: str | None = None,
+        difficulty: str = DEFAULT_DIFFICULTY,
+        room_class: str = DEFAULT_ROOM_CLASS,
+        balls: int = 1,
+        physics: str = DEFAULT_PHYSICS,
+        resume: str | None = None
+) -> Optional[Tuple[GameRoom, Player]]:
+    """Seat a player in an existing or new room and queue their session messages.
+
+    Raises HTTPException for invalid requests, returns None when the socket
+    was closed with a specific code instead.
+    """
+    if not player_name:
+        raise HTTPException(status_code=400, detail="Player name is required")
+
+    # Resume a seat with the token issued at join, it names the room
+    if resume:
+        room_id = verify_resume_token(resume, player_uuid)
+        if not room_id:
+            await websocket.close(code=POLICY_VIOLATION_CODE, reason="Invalid resume token")
+            return None
+        # A room missing here, e.g. after a drain migration, is joined by its id like any other
+
+    # Validate or create room
+    if not room_id:
+        room_id = str(uuid.uuid4())
+    elif not is_room_id(room_id):
+        raise HTTPException(status_code=400, detail="Invalid room id")
+
+    # Reject players already connected to another room
+    existing = connection_registry.find_player(player_uuid)
+    if existing and existing.room.game_id != room_id:
+        raise HTTPException(status_code=409, detail="Player already connected")
+
+    # Get existing room or create new one
+    room = game_loop.rooms.get(room_id)
+    if not room:
+        if game_loop.draining:
+            await websocket.close(code=TRY_AGAIN_LATER_CODE, reason="Server is draining")
+            return None
+        if not game_loop.capacity.can_admit_room():
+            logger.warning("Room rejected - server at capacity", extra={"room": room_id, "player": player_uuid})
+            await websocket.close(
+                code=TRY_AGAIN_LATER_CODE,
+                reason=f"Server at capacity, retry after {RETRY_AFTER}s"
+            )
+            return None
+        if room_class not in TICK_RATES:
+            raise HTTPException(status_code=400, detail="Unknown room class")
+        if not 1 <= balls <= Game.MAX_BALLS:
+            raise HTTPException(status_code=400, detail=f"Ball count must be between 1 and {Game.MAX_BALLS}")
+        if physics not in PHYSICS_BACKENDS or (physics == "fixed" and balls != 1):
+            raise HTTPException(status_code=400, detail="Unknown physics backend for this room")
+        if opponent == "bot" and difficulty not in DIFFICULTIES:
+            raise HTTPException(status_code=400, detail="Unknown bot difficulty")
+        room = GameRoom(room_id, tick_rate=TICK_RATES[room_class], balls=balls, physics=physics)
+        if opponent == "bot":
+            room.add_bot(difficulty)
+        game_loop.capacity.admit_room()
+        game_loop.add_room(room)
+
+    rejoining = player_uuid in room.players
+    if not await room.connect(websocket, player_name, player_uuid):
+        raise HTTPException(status_code=409, detail="Room is full")
+
+    player = room.get_player(websocket)
+    session = [encode_game_id(room.game_id), encode_session(issue_resume_token(room.game_id, player_uuid))]
+    if rejoining:
+        # Send the full state right away instead of waiting for the next broadcast
+        await websocket.send_bytes(encode_batch(session + [room.catch_up()]))
+    else:
+        player.outbox.extend(session)
+    return room, player
+
+
+def leave_game(websocket: WebSocket, room: GameRoom, game_loop) -> None:
+    room.disconnect(websocket)
+    # Remove room if no players, bots do not keep a room alive
+    # Finished rooms may already be compacted and their id reused
+    if (not room.players or (room.bots and not room.connected_humans)) and game_loop \
+            and game_loop.rooms.get(room.game_id) is room:
+        game_loop.remove_room(room.game_id)
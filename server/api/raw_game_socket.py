@@ -0,0 +1,164 @@
+import asyncio
+import os
+import time
+from typing import Dict, List
+from urllib.parse import parse_qs
+
+from starlette.exceptions import HTTPException
+from starlette.types import ASGIApp, Receive, Scope, Send
+from starlette.websockets import WebSocketDisconnect
+
+from api.game_socket_handler import (
+    ALLOWED_ORIGINS, CONNECTION_TIMEOUT, POLICY_VIOLATION_CODE, join_game, leave_game
+)
+from core.bots import DEFAULT_DIFFICULTY
+from core.game_loop import game_loop
+from core.game_room import DEFAULT_PHYSICS, DEFAULT_ROOM_CLASS, GameRoom, Player
+from core.heartbeat import record_heartbeat
+from domain.enums import GameState
+from logger import logger
+from networking.binary_protocol import CommandType, decode_heartbeat
+
+RAW_GAME_SOCKET = os.getenv("RAW_GAME_SOCKET", "0") == "1"  # Serve /game without the Starlette wrapper
+GAME_SOCKET_PATH = "/game"
+
+
+class RawWebSocket:
+    """The part of Starlette's WebSocket that rooms and the registry use, on the raw ASGI send."""
+
+    def __init__(self, send: Send):
+        self.send = send
+        self.closed = False
+
+    async def send_bytes(self, data: bytes) -> None:
+        if self.closed:
+            raise RuntimeError('Cannot call "send" once a close message has been sent.')
+        try:
+            await self.send({"type": "websocket.send", "bytes": data})
+        except OSError:
+            raise WebSocketDisconnect(code=1006)
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        if self.closed:
+            raise RuntimeError('Cannot call "send" once a close message has been sent.')
+        self.closed = True
+        await self.send({"type": "websocket.close", "code": code, "reason": reason or ""})
+
+
+class RawGameSocketMiddleware:
+    """Serves the game socket straight from ASGI messages, everything else goes to the app."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "websocket" and scope["path"] == GAME_SOCKET_PATH:
+            await serve_game_socket(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+async def serve_game_socket(scope: Scope, receive: Receive, send: Send) -> None:
+    """Same checks and room handling as handle_game_connection, with a lean receive loop."""
+    if (await receive())["type"] != "websocket.connect":
+        return
+    await send({"type": "websocket.accept"})
+    websocket = RawWebSocket(send)
+
+    query: Dict[str, List[str]] = parse_qs(scope["query_string"].decode("latin-1"))
+
+    def param(name: str, default: str | None = None) -> str | None:
+        return query.get(name, [default])[0]
+
+    player_uuid = param("player_uuid")
+    if not player_uuid:
+        await websocket.close(code=1003, reason="Player UUID required")
+        return
+    origin = next((value.decode("latin-1") for key, value in scope["headers"] if key == b"origin"), None)
+    if origin not in ALLOWED_ORIGINS:
+        await websocket.close(code=1003, reason="Origin not allowed")
+        return
+    try:
+        balls = int(param("balls", "1"))
+    except ValueError:
+        await websocket.close(code=POLICY_VIOLATION_CODE, reason="Invalid ball count")
+        return
+
+    room_id = param("room_id")
+    room = None
+    player = None
+    try:
+        joined = await join_game(
+            websocket, param("player_name"), room_id, player_uuid, game_loop, param("opponent"),
+            param("difficulty", DEFAULT_DIFFICULTY), param("room_class", DEFAULT_ROOM_CLASS), balls,
+            param("physics", DEFAULT_PHYSICS), param("resume")
+        )
+        if not joined:
+            return
+        room, player = joined
+        room_id = room.game_id
+        await receive_commands(receive, room, player)
+    except TimeoutError:
+        logger.warning("Connection timeout", extra={"room": room_id, "player": player_uuid})
+        await close_with_error(websocket, "408: Connection timeout")
+    except WebSocketDisconnect:
+        logger.info("WebSocket disconnected", extra={"room": room_id, "player": player_uuid})
+    except HTTPException as e:
+        logger.error("Error in websocket connection: %s", e.detail, extra={"room": room_id, "player": player_uuid})
+        await close_with_error(websocket, str(e))
+    except Exception as e:
+        logger.error("Error in websocket connection: %s", e, extra={"room": room_id, "player": player_uuid})
+        await close_with_error(websocket, "500: Internal server error")
+    finally:
+        if player:
+            leave_game(websocket, room, game_loop)
+
+
+async def close_with_error(websocket: RawWebSocket, reason: str) -> None:
+    """Close like the /game endpoint does when handle_game_connection raises."""
+    try:
+        await websocket.close(code=4000, reason=reason)
+    except (RuntimeError, OSError):
+        pass  # WebSocket already closed
+
+
+async def receive_commands(receive: Receive, room: GameRoom, player: Player) -> None:
+    """Apply commands until the client disconnects.
+
+    The idle deadline is checked once per CONNECTION_TIMEOUT against the
+    player's last message, instead of being re-armed for every message.
+    """
+    game = room.game_state
+    paddle = game.left_paddle if player.role == "left" else game.right_paddle
+    moves = {CommandType.PADDLE_UP: paddle.move_up, CommandType.PADDLE_DOWN: paddle.move_down}
+    loop = asyncio.get_running_loop()
+
+    async with asyncio.timeout(None) as idle:
+        def check_idle() -> None:
+            nonlocal watchdog
+            remaining = player.last_seen + CONNECTION_TIMEOUT - time.monotonic()
+            if remaining <= 0:
+                idle.reschedule(loop.time())
+            else:
+                watchdog = loop.call_later(remaining, check_idle)
+
+        watchdog = loop.call_later(CONNECTION_TIMEOUT, check_idle)
+        try:
+            while True:
+                message = await receive()
+                data = message.get("bytes")
+                if data is None:
+                    if message["type"] == "websocket.disconnect":
+                        return
+                    continue
+
+                player.last_seen = time.monotonic()
+                if not data:
+                    continue
+                command = data[0]
+                if command == CommandType.HEARTBEAT:
+                    record_heartbeat(player, decode_heartbeat(data))
+                elif command in moves and game.state == GameState.PLAYING:
+                    room.change_game(moves[command])
+        finally:
+            watchdog.cancel()
@@ -0,0 +1,88 @@
+"""In-process load test of the simulation with bot-vs-bot rooms.
+
+Seats two server-side bots in each room and drives ``GameLoop.tick`` at the
+rooms' tick rate, without any sockets. Reports the cost per tick and the
+share of the tick budget it uses.
+
+Run from the ``server`` directory:
+
+    python -m benchmarks.bot_load --rooms 2000 --duration 30 --difficulty medium
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.bots import DEFAULT_DIFFICULTY, DIFFICULTIES  # noqa: E402
+from core.game_loop import GameLoop  # noqa: E402
+from core.game_room import DEFAULT_ROOM_CLASS, TICK_RATES, GameRoom  # noqa: E402
+from core.results_store import ResultsStore  # noqa: E402
+
+
+async def run(rooms: int, duration: float, difficulty: str, workers: int, room_class: str) -> list[float]:
+    # Finished matches are recorded like in the server, in a throwaway database
+    with tempfile.TemporaryDirectory() as directory:
+        results = ResultsStore(str(Path(directory) / "results.db"))
+        results.start()
+        try:
+            return await run_rooms(rooms, duration, difficulty, workers, room_class, results)
+        finally:
+            results.stop()
+
+
+async def run_rooms(rooms: int, duration: float, difficulty: str, workers: int, room_class: str,
+                    results: ResultsStore) -> list[float]:
+    loop = GameLoop(simulation_workers=workers, results=results)
+    if workers > 0:
+        loop.start_executor()
+
+    for _ in range(rooms):
+        room = GameRoom(str(uuid.uuid4()), tick_rate=TICK_RATES[room_class])
+        room.add_bot(difficulty)
+        room.add_bot(difficulty)
+        loop.add_room(room)
+
+    tick_times = []
+    until = time.monotonic() + duration
+    while time.monotonic() < until:
+        started = time.perf_counter()
+        await loop.tick()
+        elapsed = time.perf_counter() - started
+        tick_times.append(elapsed)
+        await asyncio.sleep(loop.time_until_next_tick())
+
+    await loop.stop()
+    return tick_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rooms", type=int, default=1000, help="Number of bot-vs-bot rooms")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run")
+    parser.add_argument("--difficulty", choices=list(DIFFICULTIES), default=DEFAULT_DIFFICULTY)
+    parser.add_argument("--workers", type=int, default=0, help="Simulation worker threads")
+    parser.add_argument("--room-class", choices=list(TICK_RATES), default=DEFAULT_ROOM_CLASS)
+    args = parser.parse_args()
+
+    tick_times = sorted(t * 1000 for t in asyncio.run(
+        run(args.rooms, args.duration, args.difficulty, args.workers, args.room_class)
+    ))
+    budget_ms = 1000 / TICK_RATES[args.room_class]
+    p50 = statistics.median(tick_times)
+    p99 = tick_times[int(len(tick_times) * 0.99)]
+
+    print(f"Rooms: {args.rooms} {args.room_class} ({args.difficulty} bots, {args.workers} workers)")
+    print(f"Ticks: {len(tick_times)}")
+    print(f"Tick cost: p50 {p50:.2f} ms, p99 {p99:.2f} ms, max {tick_times[-1]:.2f} ms")
+    print(f"Budget used: p50 {p50 / budget_ms:.0%}, p99 {p99 / budget_ms:.0%} of {budget_ms:.2f} ms")
+    print(f"Per room: {p50 / args.rooms * 1000:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
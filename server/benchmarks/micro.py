@@ -0,0 +1,313 @@
+"""Microbenchmarks for the domain physics and binary protocol hot paths.
+
+Each case is timed over several repeats and reported as nanoseconds per
+operation. Save a baseline, then compare later runs against it; the run fails
+when any case's best repeat regresses by more than the threshold. The best
+repeat is the least affected by scheduler noise, so it is what gets compared.
+
+Run from the ``server`` directory:
+
+    python -m benchmarks.micro --save benchmarks/baseline.json
+    python -m benchmarks.micro --compare benchmarks/baseline.json --threshold 15
+"""
+import argparse
+import asyncio
+import json
+import math
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from domain.ball import Ball  # noqa: E402
+from domain.enums import GameSide, GameState  # noqa: E402
+from domain.fixed_point import FixedPointGame  # noqa: E402
+from domain.game import Game  # noqa: E402
+from domain.paddle import Paddle  # noqa: E402
+from networking import binary_protocol as protocol  # noqa: E402
+
+TARGET_SECONDS = 0.2  # Approximate duration of one repeat
+BENCHMARKS: Dict[str, Callable[[], Callable[[int], float]]] = {}
+
+
+def benchmark(name: str):
+    """Register a case. The decorated setup returns run(n) -> elapsed seconds for n operations."""
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def timed(op: Callable[[], object]) -> Callable[[int], float]:
+    def run(n: int) -> float:
+        started = time.perf_counter()
+        for _ in range(n):
+            op()
+        return time.perf_counter() - started
+    return run
+
+
+def rallying_game() -> Game:
+    """A game in play whose paddles follow the ball, so the rally never ends."""
+    game = Game()
+    game.player_count = 2
+    game.state = GameState.PLAYING
+    game.ball.first_serve = False
+    game.ball.reset(GameSide.LEFT)
+    game.ball.angle = math.pi * 0.9
+    return game
+
+
+@benchmark("ball.update_position")
+def bench_ball_update_position():
+    ball = Ball(angle=0.7)
+
+    def op():
+        ball.update_position(Game.PHYSICS_STEP)
+        if not 0 < ball.x < 1:
+            ball.x = 0.5
+    return timed(op)
+
+
+@benchmark("paddle.is_on_paddle")
+def bench_paddle_is_on_paddle():
+    paddle = Paddle(Game.LEFT_PADDLE_X)
+    ball = Ball(x=Game.LEFT_PADDLE_X + 0.01, y=0.5)
+    return timed(lambda: paddle.is_on_paddle(ball))
+
+
+@benchmark("game.update")
+def bench_game_update():
+    game = rallying_game()
+
+    def op():
+        game.left_paddle.y_position = game.right_paddle.y_position = game.ball.y
+        game.update(1 / 60)
+    return timed(op)
+
+
+@benchmark("fixed_point.update")
+def bench_fixed_point_update():
+    game = FixedPointGame(seed=1)
+    game.add_player()
+    game.add_player()
+    game.wait_steps = 0
+    game.serve(GameSide.LEFT)
+
+    def op():
+        game.left_paddle.y = game.right_paddle.y = game.y
+        game.update(1 / 60)
+    return timed(op)
+
+
+@benchmark("multi_ball.step")
+def bench_multi_ball_step():
+    from domain.multi_ball import MultiBallGame
+
+    game = MultiBallGame(balls=MultiBallGame.MAX_BALLS)
+    game.serve(~game.active)
+    game.vy[:] = game.vx * 0.5
+
+    def op():
+        game.left_paddle.y_position = game.right_paddle.y_position = float(game.y[0])
+        game.step()
+        game.serve(~game.active)
+    return timed(op)
+
+
+@benchmark("game.calc_angle")
+def bench_game_calc_angle():
+    game = rallying_game()
+    game.ball.y = game.left_paddle.y_position + 0.03
+    return timed(lambda: game.calc_angle(game.left_paddle))
+
+
+@benchmark("encode_game_state")
+def bench_encode_game_state():
+    return timed(lambda: protocol.encode_game_state(0.5, 0.25, 0.45, 0.55, 2, 3, None))
+
+
+@benchmark("encode_multi_ball_state")
+def bench_encode_multi_ball_state():
+    positions = bytes(8 * Game.MAX_BALLS)
+    return timed(lambda: protocol.encode_multi_ball_state(positions, 0.45, 0.55, 2, 3, None))
+
+
+@benchmark("encode_game_status")
+def bench_encode_game_status():
+    return timed(lambda: protocol.encode_game_status("game_in_progress"))
+
+
+@benchmark("encode_game_id")
+def bench_encode_game_id():
+    game_id = str(uuid.uuid4())
+    return timed(lambda: protocol.encode_game_id(game_id))
+
+
+@benchmark("encode_game_update")
+def bench_encode_game_update():
+    game_id = uuid.uuid4()
+    return timed(lambda: protocol.encode_game_update(
+        protocol.GameUpdateType.SCORE_UPDATE, game_id, GameState.PLAYING, 2, 1, 2, None
+    ))
+
+
+@benchmark("encode_reconnect")
+def bench_encode_reconnect():
+    return timed(lambda: protocol.encode_reconnect("pong.malpou.io", 1500))
+
+
+@benchmark("encode_ping")
+def bench_encode_ping():
+    return timed(lambda: protocol.encode_ping(123456))
+
+
+@benchmark("encode_batch")
+def bench_encode_batch():
+    messages = [
+        protocol.encode_game_state(0.5, 0.25, 0.45, 0.55, 2, 3, None),
+        protocol.encode_game_status("game_in_progress"),
+    ]
+    return timed(lambda: protocol.encode_batch(messages))
+
+
+@benchmark("decode_command")
+def bench_decode_command():
+    data = bytes([protocol.CommandType.PADDLE_UP])
+    return timed(lambda: protocol.decode_command(data))
+
+
+@benchmark("decode_heartbeat")
+def bench_decode_heartbeat():
+    data = bytes([protocol.CommandType.HEARTBEAT]) + (123456).to_bytes(4, "big")
+    return timed(lambda: protocol.decode_heartbeat(data))
+
+
+@benchmark("frame_ring.publish")
+def bench_frame_ring_publish():
+    from core.frame_export import FrameRing
+
+    with tempfile.TemporaryDirectory() as directory:
+        ring = FrameRing(str(Path(directory) / "bench.ring"))
+    # The mapping stays valid after the file is removed
+    frame = protocol.encode_batch([protocol.encode_game_state(0.5, 0.25, 0.45, 0.55, 2, 3, None)])
+    return timed(lambda: ring.publish(frame))
+
+
+class FakeWebSocket:
+    async def send_bytes(self, data: bytes) -> None:
+        pass
+
+
+def playing_room():
+    """An event loop and a room in play with two fake connections."""
+    from core.connection_registry import ConnectionRegistry
+    from core.game_room import GameRoom
+
+    loop = asyncio.new_event_loop()
+    room = GameRoom(str(uuid.uuid4()), registry=ConnectionRegistry())
+    loop.run_until_complete(room.connect(FakeWebSocket(), "left", str(uuid.uuid4())))
+    loop.run_until_complete(room.connect(FakeWebSocket(), "right", str(uuid.uuid4())))
+    room.game_state.state = GameState.PLAYING
+    room.game_state.starting_state = False
+    loop.run_until_complete(room.flush())
+    return loop, room
+
+
+@benchmark("room.broadcast_unchanged")
+def bench_room_broadcast_unchanged():
+    loop, room = playing_room()
+
+    async def broadcast(n: int) -> float:
+        started = time.perf_counter()
+        for _ in range(n):
+            room.queue_state()
+            await room.flush()
+        return time.perf_counter() - started
+
+    return lambda n: loop.run_until_complete(broadcast(n))
+
+
+@benchmark("room.broadcast_state")
+def bench_room_broadcast_state():
+    loop, room = playing_room()
+
+    async def broadcast(n: int) -> float:
+        started = time.perf_counter()
+        for i in range(n):
+            # Move a paddle so every state is new and gets encoded and sent
+            room.game_state.left_paddle.y_position = 0.4 + (i & 1) * 0.1
+            room.queue_state()
+            await room.flush()
+        return time.perf_counter() - started
+
+    return lambda n: loop.run_until_complete(broadcast(n))
+
+
+def measure(run: Callable[[int], float], repeats: int) -> Dict[str, float]:
+    # Calibrate the number of operations per repeat
+    n = 100
+    while (elapsed := run(n)) < TARGET_SECONDS / 10:
+        n *= 10
+    n = max(int(n * TARGET_SECONDS / elapsed), 1)
+
+    per_op = [run(n) / n * 1e9 for _ in range(repeats)]
+    return {"median_ns": statistics.median(per_op), "min_ns": min(per_op), "ops": n}
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> bool:
+    print(f"\n{'case':<26}{'baseline ns':>14}{'current ns':>14}{'change':>10}")
+    regressed = False
+    for name, result in results.items():
+        base = baseline["cases"].get(name)
+        if not base:
+            print(f"{name:<26}{'-':>14}{result['min_ns']:>14.1f}{'new':>10}")
+            continue
+        change = (result["min_ns"] - base["min_ns"]) / base["min_ns"] * 100
+        flag = "  REGRESSION" if change > threshold else ""
+        regressed |= change > threshold
+        print(f"{name:<26}{base['min_ns']:>14.1f}{result['min_ns']:>14.1f}{change:>+9.1f}%{flag}")
+    return not regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cases", nargs="*", choices=list(BENCHMARKS), default=list(BENCHMARKS),
+                        help="Cases to run (default: all)")
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--save", type=Path, help="Write results as a baseline to this file")
+    parser.add_argument("--compare", type=Path, help="Compare against this baseline")
+    parser.add_argument("--threshold", type=float, default=15.0, help="Allowed slowdown in percent")
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.cases:
+        results[name] = measure(BENCHMARKS[name](), args.repeats)
+        print(f"{name:<26}{results[name]['median_ns']:>10.1f} ns/op (min {results[name]['min_ns']:.1f})")
+
+    if args.save:
+        args.save.write_text(json.dumps({
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cases": results,
+        }, indent=2))
+        print(f"\nBaseline written to {args.save}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if baseline.get("python") != platform.python_version():
+            print(f"\nWarning: baseline was recorded on Python {baseline.get('python')}")
+        if not compare(results, baseline, args.threshold):
+            print(f"\nFAIL: regression above {args.threshold:.0f}%")
+            sys.exit(1)
+        print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""Compare runtime profiles under the same synthetic load.
+
+For each profile a fresh server is started with ``runtime.py``, a number of
+two-player games are driven by clients built on the integration test client,
+and the following is reported:
+
+- state frames received per second (all clients)
+- frames per CPU-second of the server process (frames per second per core)
+- inter-frame interval p50/p99 and standard deviation (tick stability)
+
+A profile name ending in ``+raw-socket`` runs that profile with
+``RAW_GAME_SOCKET=1``; the default run includes one for the default profile.
+
+Run from the ``server`` directory:
+
+    python -m benchmarks.runtime_profiles --games 20 --duration 20
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import signal
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import websockets
+
+SERVER_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SERVER_DIR / "tests"))
+sys.path.insert(0, str(SERVER_DIR))
+
+from integration import PongClient  # noqa: E402
+from runtime import DEFAULT_PROFILE, PROFILES  # noqa: E402
+
+RAW_SOCKET_SUFFIX = "+raw-socket"
+ORIGIN = "http://localhost:5173"
+STARTUP_TIMEOUT = 30
+SHUTDOWN_TIMEOUT = 10
+
+
+@dataclass
+class ProfileResult:
+    profile: str
+    frames: int
+    frames_per_second: float
+    frames_per_cpu_second: float
+    cpu_seconds: float
+    interval_p50_ms: float
+    interval_p99_ms: float
+    interval_stdev_ms: float
+
+
+class BenchmarkClient(PongClient):
+    def __init__(self, room_id: str, player: str, port: int):
+        super().__init__(room_id, player)
+        self.port = port
+        self.intervals: list[float] = []
+        self.frames = 0
+
+    async def connect(self):
+        uri = (f"ws://127.0.0.1:{self.port}/game?player_name={self.player}"
+               f"&room_id={self.room_id}&player_uuid={uuid.uuid4()}")
+        self.ws = await websockets.connect(uri, origin=ORIGIN)
+
+    async def measure(self, until: float):
+        last_frame = None
+        try:
+            while time.monotonic() < until:
+                frame = await asyncio.wait_for(self.ws.recv(), until - time.monotonic())
+                messages = self.split_messages(frame)
+                for message in messages:
+                    if message[0] == 0x05:  # Ping
+                        await self.ws.send(bytes([0x00]) + message[1:5])
+                data = next((m for m in messages if m[0] == 0x01), None)  # Game State
+                if data is None:
+                    continue
+
+                now = time.perf_counter()
+                if last_frame is not None:
+                    self.intervals.append(now - last_frame)
+                last_frame = now
+                self.frames += 1
+
+                state = self.parse_game_state(data)
+                paddle = state.paddle_left if self.player == "left" else state.paddle_right
+                if state.ball_y > paddle:
+                    await self.ws.send(bytes([0x02]))  # Move DOWN
+                elif state.ball_y < paddle:
+                    await self.ws.send(bytes([0x01]))  # Move UP
+        except (asyncio.TimeoutError, websockets.exceptions.ConnectionClosed):
+            pass
+        finally:
+            await self.ws.close()
+
+
+def wait_for_health(port: int):
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server did not become healthy on port {port}")
+
+
+async def drive_load(port: int, games: int, duration: float) -> list[BenchmarkClient]:
+    clients = []
+    for _ in range(games):
+        room_id = str(uuid.uuid4())
+        for role in ("left", "right"):
+            client = BenchmarkClient(room_id, role, port)
+            await client.connect()
+            clients.append(client)
+
+    until = time.monotonic() + duration
+    await asyncio.gather(*(client.measure(until) for client in clients))
+    return clients
+
+
+def run_profile(name: str, port: int, games: int, duration: float) -> ProfileResult:
+    profile = name.removesuffix(RAW_SOCKET_SUFFIX)
+    env = dict(os.environ, RAW_GAME_SOCKET="1" if profile != name else "0")
+    children_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    server = subprocess.Popen(
+        [sys.executable, "runtime.py", "--profile", profile, "--port", str(port)],
+        cwd=SERVER_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_for_health(port)
+        started = time.monotonic()
+        clients = asyncio.run(drive_load(port, games, duration))
+        elapsed = time.monotonic() - started
+    finally:
+        # SIGINT skips the drain that SIGTERM would start
+        server.send_signal(signal.SIGINT)
+        try:
+            server.wait(timeout=SHUTDOWN_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            server.kill()
+            server.wait()
+    if server.returncode != 0:
+        raise RuntimeError(f"Server for profile {name} exited with code {server.returncode}")
+
+    # The server is the only child reaped during the run
+    children_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu_seconds = (children_after.ru_utime - children_before.ru_utime
+                   + children_after.ru_stime - children_before.ru_stime)
+    frames = sum(client.frames for client in clients)
+    intervals = sorted(i * 1000 for client in clients for i in client.intervals)
+    if len(intervals) < 2:
+        raise RuntimeError(f"Profile {name} produced no state frames")
+
+    return ProfileResult(
+        profile=name,
+        frames=frames,
+        frames_per_second=frames / elapsed,
+        frames_per_cpu_second=frames / cpu_seconds if cpu_seconds else 0.0,
+        cpu_seconds=cpu_seconds,
+        interval_p50_ms=intervals[len(intervals) // 2],
+        interval_p99_ms=intervals[int(len(intervals) * 0.99)],
+        interval_stdev_ms=statistics.stdev(intervals)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", nargs="*", default=[*PROFILES, DEFAULT_PROFILE + RAW_SOCKET_SUFFIX],
+                        help=f"Profiles to compare, append {RAW_SOCKET_SUFFIX} for the raw game socket (default: all)")
+    parser.add_argument("--games", type=int, default=20, help="Concurrent games per profile")
+    parser.add_argument("--duration", type=float, default=20.0, help="Measured seconds per profile")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-p99-ms", type=float, default=25.0,
+                        help="Profiles with a worse p99 frame interval are not recommended")
+    parser.add_argument("--json", type=Path, help="Write results to this file")
+    args = parser.parse_args()
+
+    results = []
+    for name in args.profiles:
+        print(f"Benchmarking {name} ({args.games} games, {args.duration:.0f}s)...")
+        results.append(run_profile(name, args.port, args.games, args.duration))
+
+    print(f"\n{'profile':<38}{'fps':>10}{'fps/core':>12}{'cpu s':>8}{'p50 ms':>9}{'p99 ms':>9}{'stdev':>8}")
+    for r in sorted(results, key=lambda r: r.frames_per_cpu_second, reverse=True):
+        print(f"{r.profile:<38}{r.frames_per_second:>10.0f}{r.frames_per_cpu_second:>12.0f}"
+              f"{r.cpu_seconds:>8.1f}{r.interval_p50_ms:>9.2f}{r.interval_p99_ms:>9.2f}{r.interval_stdev_ms:>8.2f}")
+
+    stable = [r for r in results if r.interval_p99_ms <= args.max_p99_ms]
+    if stable:
+        best = max(stable, key=lambda r: r.frames_per_cpu_second)
+        profile = best.profile.removesuffix(RAW_SOCKET_SUFFIX)
+        raw_socket = " RAW_GAME_SOCKET=1" if profile != best.profile else ""
+        print(f"\nRecommended: PONG_RUNTIME_PROFILE={profile}{raw_socket}")
+    else:
+        print(f"\nNo profile kept the p99 frame interval under {args.max_p99_ms} ms")
+
+    if args.json:
+        args.json.write_text(json.dumps([asdict(r) for r in results], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Startup-time benchmark for the server import path.
+
+Profiles ``import main`` in fresh interpreters, prints the slowest imports and
+fails when the median cold import exceeds the budget or when a module that
+must stay off the server import path (SciPy, matplotlib) gets loaded.
+
+Run from the ``server`` directory:
+
+    python -m benchmarks.startup --runs 5 --budget-ms 1500
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SERVER_DIR = Path(__file__).resolve().parent.parent
+
+FORBIDDEN_MODULES = ("scipy", "matplotlib", "numpy")
+
+CHECK_MODULES = (
+    "import importlib, sys; importlib.import_module(sys.argv[1]); "
+    "print(','.join(sorted({m.split('.')[0] for m in sys.modules} & set(sys.argv[2:]))))"
+)
+
+
+def profile_imports(entry: str) -> list[tuple[int, int, str]]:
+    """Run ``-X importtime`` and return (self_us, cumulative_us, module) rows."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {entry}"],
+        cwd=SERVER_DIR, capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), module.rstrip()))
+    return rows
+
+
+def measure_cold_import(entry: str, runs: int) -> list[float]:
+    """Measure wall-clock import time of ``entry`` in fresh interpreters (ms)."""
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {entry}; "
+        "print((time.perf_counter() - start) * 1000)"
+    )
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=SERVER_DIR, capture_output=True, text=True, check=True
+        )
+        timings.append(float(result.stdout.strip()))
+    return timings
+
+
+def loaded_forbidden_modules(entry: str) -> list[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", CHECK_MODULES, entry, *FORBIDDEN_MODULES],
+        cwd=SERVER_DIR, capture_output=True, text=True, check=True
+    )
+    output = result.stdout.strip()
+    return output.split(",") if output else []
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entry", default="main", help="Module to import (default: main)")
+    parser.add_argument("--runs", type=int, default=5, help="Number of cold import runs")
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="Maximum median import time")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest imports to show")
+    args = parser.parse_args()
+
+    rows = profile_imports(args.entry)
+    print(f"Slowest imports for '{args.entry}' (cumulative):")
+    for self_us, cumulative_us, module in sorted(rows, key=lambda r: r[1], reverse=True)[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  (self {self_us / 1000:6.1f} ms)  {module}")
+
+    timings = measure_cold_import(args.entry, args.runs)
+    median = statistics.median(timings)
+    print(f"\nCold import over {args.runs} runs: median {median:.1f} ms, "
+          f"min {min(timings):.1f} ms, max {max(timings):.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    forbidden = loaded_forbidden_modules(args.entry)
+    if forbidden:
+        print(f"\nFAIL: forbidden modules on the server import path: {', '.join(forbidden)}")
+        failed = True
+    if median > args.budget_ms:
+        print(f"\nFAIL: median import time {median:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+        failed = True
+
+    if failed:
+        sys.exit(1)
+    print("\nStartup benchmark passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable
+
+from domain.ball import Ball
+from domain.enums import GameSide, GameState
+from domain.paddle import Paddle
+
+if TYPE_CHECKING:
+    from core.game_room import GameRoom
+
+
+@dataclass(frozen=True)
+class BotDifficulty:
+    reaction_time: float  # Seconds between re-aiming
+    aim_error: float  # Maximum aiming error as percentage of screen height
+    predictive: bool  # Aim at the predicted intercept instead of the ball
+
+
+DIFFICULTIES = {
+    "easy": BotDifficulty(reaction_time=0.25, aim_error=0.08, predictive=False),
+    "medium": BotDifficulty(reaction_time=0.13, aim_error=0.04, predictive=False),
+    "hard": BotDifficulty(reaction_time=0.05, aim_error=0.01, predictive=True),
+}
+DEFAULT_DIFFICULTY = "medium"
+
+
+@dataclass
+class Bot:
+    role: str
+    difficulty: BotDifficulty
+    target_y: float = Paddle.INITIAL_Y
+    time_until_decision: float = field(default=0.0)
+
+
+def predict_intercept(ball: Ball, x: float) -> float:
+    """Predict where the ball crosses x, folding in bounces off top and bottom."""
+    v_x = math.cos(ball.angle)
+    if abs(v_x) < 1e-9:
+        return ball.y
+    travel = (x - ball.x) / v_x
+    y = ball.y + travel * math.sin(ball.angle)
+
+    # Fold the unbounded trajectory back into the playing field
+    low, high = ball.radius, 1 - ball.radius
+    span = high - low
+    offset = (y - low) % (2 * span)
+    return low + (offset if offset <= span else 2 * span - offset)
+
+
+class BotController:
+    """Decides paddle moves for every bot across all rooms in one pass per tick."""
+
+    def __init__(self, seed: int | None = None):
+        self.rng = random.Random(seed)
+
+    def step(self, rooms: Iterable[GameRoom]) -> None:
+        for room in rooms:
+            game = room.game_state
+            if game.state != GameState.PLAYING:
+                continue
+
+            dt = room.tick_interval
+            for bot in room.bots:
+                paddle = game.left_paddle if bot.role == "left" else game.right_paddle
+                if bot.time_until_decision <= 0:
+                    bot.target_y = self.aim(bot, game.ball_for(GameSide(bot.role)), paddle)
+                    bot.time_until_decision = bot.difficulty.reaction_time
+                bot.time_until_decision -= dt
+
+                # Same effect as holding the key for the whole tick
+                dead_zone = paddle.speed * dt
+                if bot.target_y < paddle.y_position - dead_zone:
+                    paddle.move_up(dt)
+                elif bot.target_y > paddle.y_position + dead_zone:
+                    paddle.move_down(dt)
+
+    def aim(self, bot: Bot, ball: Ball, paddle: Paddle) -> float:
+        moving_left = math.cos(ball.angle) < 0
+        incoming = moving_left == (bot.role == "left")
+        if not incoming:
+            return Paddle.INITIAL_Y
+
+        if bot.difficulty.predictive:
+            target = predict_intercept(ball, paddle.x_position)
+        else:
+            target = ball.y
+        return target + self.rng.uniform(-bot.difficulty.aim_error, bot.difficulty.aim_error)
+
+
+bot_controller = BotController()
@@ -0,0 +1,65 @@
+import os
+from typing import Dict
+
+TARGET_UTILIZATION = float(os.getenv("TARGET_TICK_UTILIZATION", "0.7"))  # Share of loop time spent ticking
+MAX_ROOMS = int(os.getenv("MAX_ROOMS", "0"))  # Hard room limit, 0 for none
+RETRY_AFTER = 5  # Seconds clients and load balancers should wait before retrying
+COST_SMOOTHING = 0.05  # Weight of a new tick in the smoothed tick cost and period
+
+
+class CapacityManager:
+    """Track the measured loop utilization and decide whether new rooms still fit.
+
+    Rooms tick at different rates, so the budget is the share of wall time the
+    loop spends in ticks rather than a fixed per-tick duration.
+    """
+
+    def __init__(self, target_utilization: float = TARGET_UTILIZATION, max_rooms: int = MAX_ROOMS):
+        self.target_utilization = target_utilization
+        self.max_rooms = max_rooms
+        self.tick_cost = 0.0  # Smoothed seconds per loop iteration spent ticking
+        self.tick_period = 0.0  # Smoothed seconds between loop iterations
+        self.room_count = 0
+
+    def record_tick(self, cost: float, period: float, room_count: int) -> None:
+        self.tick_cost += COST_SMOOTHING * (cost - self.tick_cost)
+        self.tick_period += COST_SMOOTHING * (period - self.tick_period)
+        self.room_count = room_count
+
+    @property
+    def utilization(self) -> float:
+        return self.tick_cost / self.tick_period if self.tick_period else 0.0
+
+    @property
+    def room_cost(self) -> float:
+        """Smoothed share of loop time used per room."""
+        return self.utilization / self.room_count if self.room_count else 0.0
+
+    @property
+    def headroom(self) -> int | None:
+        """Estimated number of rooms that still fit, None when there is no known limit."""
+        limits = []
+        if self.max_rooms:
+            limits.append(self.max_rooms - self.room_count)
+        if self.room_cost > 0:
+            spare = self.target_utilization - self.utilization
+            limits.append(int(spare / self.room_cost))
+        elif self.utilization >= self.target_utilization:
+            limits.append(0)
+        return max(min(limits), 0) if limits else None
+
+    def can_admit_room(self) -> bool:
+        headroom = self.headroom
+        return headroom is None or headroom > 0
+
+    def admit_room(self) -> None:
+        """Count an admitted room right away so a burst of joins cannot overshoot before the next tick."""
+        self.room_count += 1
+
+    def report(self) -> Dict:
+        return {
+            "rooms": self.room_count,
+            "headroom": self.headroom,
+            "tick_cost_ms": round(self.tick_cost * 1000, 3),
+            "tick_utilization": round(self.utilization, 3),
+        }
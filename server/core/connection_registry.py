@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Set
+
+from fastapi import WebSocket
+from starlette.websockets import WebSocketDisconnect
+
+from logger import logger
+
+if TYPE_CHECKING:
+    from core.game_room import GameRoom, Player
+
+
+@dataclass(frozen=True)
+class Connection:
+    room: GameRoom
+    player: Player
+
+
+class ConnectionRegistry:
+    """Server-wide index of live player connections.
+
+    Connections are looked up by websocket or player uuid in O(1), and the
+    set of connected players is tracked per room.
+    """
+
+    def __init__(self):
+        self.by_websocket: Dict[WebSocket, Connection] = {}
+        self.by_player: Dict[str, Connection] = {}  # player uuid -> Connection
+        self.by_room: Dict[str, Set[str]] = {}  # room id -> connected player uuids
+
+    def __len__(self) -> int:
+        return len(self.by_websocket)
+
+    def __iter__(self) -> Iterator[Connection]:
+        return iter(list(self.by_websocket.values()))
+
+    def register(self, room: GameRoom, player: Player) -> None:
+        connection = Connection(room, player)
+        self.by_websocket[player.websocket] = connection
+        self.by_player[player.uuid] = connection
+        self.by_room.setdefault(room.game_id, set()).add(player.uuid)
+
+    def unregister(self, websocket: WebSocket) -> Optional[Connection]:
+        connection = self.by_websocket.pop(websocket, None)
+        if not connection:
+            return None
+
+        player_uuid = connection.player.uuid
+        if self.by_player.get(player_uuid) is connection:
+            del self.by_player[player_uuid]
+        room_players = self.by_room.get(connection.room.game_id)
+        if room_players is not None:
+            room_players.discard(player_uuid)
+            if not room_players:
+                del self.by_room[connection.room.game_id]
+        return connection
+
+    def get(self, websocket: WebSocket) -> Optional[Connection]:
+        return self.by_websocket.get(websocket)
+
+    def find_player(self, player_uuid: str) -> Optional[Connection]:
+        return self.by_player.get(player_uuid)
+
+    def room_player_count(self, room_id: str) -> int:
+        return len(self.by_room.get(room_id, ()))
+
+    async def kick(self, player_uuid: str, code: int, reason: str) -> bool:
+        """Disconnect a player wherever they are connected and close the socket."""
+        connection = self.find_player(player_uuid)
+        if not connection:
+            return False
+
+        websocket = connection.player.websocket
+        connection.room.disconnect(websocket)
+        try:
+            await websocket.close(code=code, reason=reason)
+        except (WebSocketDisconnect, RuntimeError):
+            pass  # WebSocket already closed
+        logger.info("Kicked %s (%s)", connection.player.name, reason,
+                    extra={"room": connection.room.game_id, "player": player_uuid})
+        return True
+
+
+connection_registry = ConnectionRegistry()
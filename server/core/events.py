@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, Callable, Dict, List, Sequence, Type
+
+from domain.enums import GameState
+from domain.events import GameEvent, GoalScored, PlayerJoined, PlayerLeft, StateChanged
+from logger import logger
+
+if TYPE_CHECKING:
+    from core.game_room import GameRoom
+
+Subscriber = Callable[["GameRoom", List[GameEvent]], None]
+
+
+class EventBus:
+    """Delivers the events a room buffered during a tick to their subscribers.
+
+    The simulation only appends events to a list; after the step each
+    subscriber gets all events of its type from that tick in one call, so
+    adding observers does not slow the simulation itself.
+    """
+
+    def __init__(self):
+        self.subscribers: Dict[Type[GameEvent], List[Subscriber]] = defaultdict(list)
+        self.counts: Counter[str] = Counter()  # Events published per type
+
+    def subscribe(self, event_type: Type[GameEvent], subscriber: Subscriber) -> None:
+        self.subscribers[event_type].append(subscriber)
+
+    def publish(self, room: GameRoom, events: Sequence[GameEvent]) -> None:
+        by_type: Dict[Type[GameEvent], List[GameEvent]] = defaultdict(list)
+        for event in events:
+            by_type[type(event)].append(event)
+
+        for event_type, batch in by_type.items():
+            self.counts[event_type.__name__] += len(batch)
+            for subscriber in self.subscribers.get(event_type, ()):
+                try:
+                    subscriber(room, batch)
+                except Exception as e:
+                    logger.error("Error in %s subscriber: %s", event_type.__name__, e, extra={"room": room.game_id})
+
+
+def log_goals(room: GameRoom, events: List[GoalScored]) -> None:
+    last = events[-1]
+    logger.info("Current score - Left: %d, Right: %d - %s SCORED!", last.left_score, last.right_score,
+                last.scorer.value.upper(), extra={"room": room.game_id})
+
+
+def log_joins(room: GameRoom, events: List[PlayerJoined]) -> None:
+    for event in events:
+        logger.info("Player %s %s", event.name, "reconnected" if event.reconnected else "connected",
+                    extra={"room": room.game_id, "player": event.player, "role": event.role})
+
+
+def log_leaves(room: GameRoom, events: List[PlayerLeft]) -> None:
+    for event in events:
+        logger.info("Player %s disconnected", event.name,
+                    extra={"room": room.game_id, "player": event.player, "role": event.role})
+
+
+STATE_CHANGE_MESSAGES = {
+    GameState.PAUSED: "Game paused",
+    GameState.GAME_OVER: "Game over",
+}
+
+
+def log_state_changes(room: GameRoom, events: List[StateChanged]) -> None:
+    for event in events:
+        message = STATE_CHANGE_MESSAGES.get(event.current)
+        if message:
+            logger.info(message, extra={"room": room.game_id})
+
+
+event_bus = EventBus()
+event_bus.subscribe(GoalScored, log_goals)
+event_bus.subscribe(PlayerJoined, log_joins)
+event_bus.subscribe(PlayerLeft, log_leaves)
+event_bus.subscribe(StateChanged, log_state_changes)
@@ -0,0 +1,135 @@
+import mmap
+import os
+import struct
+import uuid
+from typing import List
+
+from logger import logger
+
+FRAME_EXPORT_DIR = os.getenv("FRAME_EXPORT_DIR", "")  # Directory of the room rings, e.g. /dev/shm/pong, empty: off
+FRAME_EXPORT_SLOTS = int(os.getenv("FRAME_EXPORT_SLOTS", "256"))  # Frames kept per room, ~4 s at 60 Hz
+FRAME_EXPORT_SLOT_SIZE = int(os.getenv("FRAME_EXPORT_SLOT_SIZE", "1024"))  # Bytes per slot, header included
+
+MAGIC = b"PONGRING"
+VERSION = 1
+# Magic, version, slot count, slot size, reserved, sequence of the last written frame
+HEADER = struct.Struct("<8sIIIIQ")
+HEADER_SIZE = 64  # Slots start on a cache line
+HEAD_OFFSET = 24  # Offset of the last written sequence in the header
+SEQUENCE = struct.Struct("<Q")
+# Sequence of the frame in the slot (0 while it is being written), frame length
+SLOT_HEADER = struct.Struct("<QI4x")
+
+
+def ring_path(directory: str, room_id: str) -> str:
+    """Path of a room's ring, refusing room ids that would leave the directory."""
+    if str(uuid.UUID(room_id)) != room_id:
+        raise ValueError(f"Room id {room_id!r} is not a canonical UUID")
+    path = os.path.realpath(os.path.join(directory, f"{room_id}.ring"))
+    if os.path.dirname(path) != os.path.realpath(directory):
+        raise ValueError(f"Ring path {path} is outside {directory}")
+    return path
+
+
+class FrameRing:
+    """Single-writer ring of encoded frames in a memory-mapped file.
+
+    Frames are numbered from 1. A frame is written by clearing its slot's
+    sequence, copying the frame and then storing the slot sequence and the
+    header sequence, so readers in other processes never take a lock: they
+    copy a slot and keep it only if its sequence matches before and after.
+    """
+
+    def __init__(self, path: str, slots: int = FRAME_EXPORT_SLOTS, slot_size: int = FRAME_EXPORT_SLOT_SIZE):
+        if slots < 1 or slot_size <= SLOT_HEADER.size:
+            raise ValueError("Frame ring needs at least one slot larger than its header")
+        self.path = path
+        self.slots = slots
+        self.slot_size = slot_size
+        self.max_frame = slot_size - SLOT_HEADER.size
+        self.sequence = 0
+        self.frames_dropped = 0
+
+        # Fill in the header before the file appears, readers never see a partial one
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        staging = f"{path}.tmp"
+        with open(staging, "w+b") as file:
+            file.truncate(HEADER_SIZE + slots * slot_size)
+            self.buffer = mmap.mmap(file.fileno(), 0)
+        HEADER.pack_into(self.buffer, 0, MAGIC, VERSION, slots, slot_size, 0, 0)
+        os.replace(staging, path)
+
+    def publish(self, frame: bytes) -> None:
+        size = len(frame)
+        if size > self.max_frame:
+            self.frames_dropped += 1
+            logger.warning("Frame of %d bytes does not fit the export ring", size)
+            return
+
+        sequence = self.sequence + 1
+        offset = HEADER_SIZE + sequence % self.slots * self.slot_size
+        start = offset + SLOT_HEADER.size
+        SLOT_HEADER.pack_into(self.buffer, offset, 0, size)
+        self.buffer[start:start + size] = frame
+        SEQUENCE.pack_into(self.buffer, offset, sequence)
+        SEQUENCE.pack_into(self.buffer, HEAD_OFFSET, sequence)
+        self.sequence = sequence
+
+    def close(self) -> None:
+        """Unmap and remove the ring, readers see FrameRingReader.closed once they read the last frames."""
+        self.buffer.close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class FrameRingReader:
+    """Tails a FrameRing from another process, starting after the frame last written.
+
+    Frames overwritten before they were read are skipped and counted in lagged.
+    """
+
+    def __init__(self, path: str):
+        self.file = open(path, "rb")
+        self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.slots, self.slot_size, _, self.sequence = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} frame ring")
+        self.max_frame = self.slot_size - SLOT_HEADER.size
+        self.lagged = 0
+
+    @property
+    def closed(self) -> bool:
+        """The room is gone and every frame it wrote has been read (or counted as lagged)."""
+        # The writer is done with the ring before it unlinks it, so the head is final once unlinked
+        if os.fstat(self.file.fileno()).st_nlink:
+            return False
+        return SEQUENCE.unpack_from(self.buffer, HEAD_OFFSET)[0] == self.sequence
+
+    def read(self) -> List[bytes]:
+        """Frames written since the last read, oldest first."""
+        head, = SEQUENCE.unpack_from(self.buffer, HEAD_OFFSET)
+        if head - self.sequence > self.slots:
+            # Fell more than a lap behind, resume at the oldest frame still in the ring
+            self.lagged += head - self.sequence - self.slots
+            self.sequence = head - self.slots
+
+        frames = []
+        buffer = self.buffer
+        while self.sequence < head:
+            self.sequence += 1
+            offset = HEADER_SIZE + self.sequence % self.slots * self.slot_size
+            sequence, size = SLOT_HEADER.unpack_from(buffer, offset)
+            start = offset + SLOT_HEADER.size
+            frame = buffer[start:start + min(size, self.max_frame)]
+            if sequence == self.sequence and SEQUENCE.unpack_from(buffer, offset)[0] == sequence:
+                frames.append(frame)
+            else:
+                self.lagged += 1  # Overwritten while we were reading it
+        return frames
+
+    def close(self) -> None:
+        self.buffer.close()
+        self.file.close()
@@ -1,46 +1,193 @@
 import asyncio
-from typing import Dict
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
+from domain.game import GameSnapshot
+
+from core.bots import bot_controller
+from core.capacity import CapacityManager
 from core.game_room import GameRoom
+from core.results_store import ResultsStore, results_store
 from logger import logger
 
 
+DRAIN_TIMEOUT = float(os.getenv("DRAIN_TIMEOUT", "60"))  # Seconds to let running matches finish
+RECONNECT_URL = os.getenv("RECONNECT_URL", "")  # Where drained clients reconnect, empty for same address
+RECONNECT_JITTER = 5.0  # Spread reconnects over this many seconds to avoid a reconnect storm
+DRAIN_POLL_INTERVAL = 0.5
+SIMULATION_WORKERS = int(os.getenv("SIMULATION_WORKERS", "0"))  # 0 simulates on the event loop thread
+IDLE_INTERVAL = 1/60  # Longest sleep between loop iterations, so new rooms start promptly
+
+
+def simulate_partition(rooms: List[GameRoom]) -> List[Optional[GameSnapshot]]:
+    """Step the simulation of a partition of rooms, runs on a worker thread."""
+    snapshots = []
+    for room in rooms:
+        try:
+            snapshots.append(room.simulate())
+        except Exception as e:
+            logger.error("Error simulating room: %s", e, extra={"room": room.game_id})
+            snapshots.append(None)
+    return snapshots
+
+
 class GameLoop:
-    def __init__(self):
+    def __init__(self, simulation_workers: int = SIMULATION_WORKERS, results: ResultsStore = results_store):
         self.rooms: Dict[str, GameRoom] = {}
+        self.bot_rooms: Dict[str, GameRoom] = {}
         self.is_running = True
+        self.draining = False
+        self.simulation_workers = simulation_workers
+        self.executor: ThreadPoolExecutor | None = None
+        self.capacity = CapacityManager()
+        self.results = results
 
     async def run(self):
+        if self.simulation_workers > 0:
+            self.start_executor()
+
+        last_started = time.perf_counter()
         while self.is_running:
-            try:
-                # Clean up expired rooms
-                expired = [room_id for room_id, room in self.rooms.items() if room.is_expired]
-                for room_id in expired:
-                    del self.rooms[room_id]
-                    logger.info(f"Removed expired room {room_id}")
+            started = time.perf_counter()
+            await self.tick()
+            finished = time.perf_counter()
+            self.capacity.record_tick(finished - started, started - last_started, len(self.rooms))
+            last_started = started
+            await asyncio.sleep(self.time_until_next_tick())
 
+    def time_until_next_tick(self) -> float:
+        """Sleep until the earliest room is due, rooms tick at their own rate."""
+        next_tick = min((room.next_tick for room in self.rooms.values()), default=float("inf"))
+        return min(max(next_tick - time.monotonic(), 0.0), IDLE_INTERVAL)
+
+    async def tick(self):
+        """Update every room whose next tick is due."""
+        try:
+            # Clean up expired rooms
+            expired = [room_id for room_id, room in self.rooms.items() if room.is_expired]
+            for room_id in expired:
+                self.remove_room(room_id)
+                logger.info("Removed expired room", extra={"room": room_id})
+
+            now = time.monotonic()
+            due = [room for room in self.rooms.values() if room.is_due(now)]
+
+            # Decide bot moves for all due bot rooms at once
+            bot_controller.step(room for room in due if room.bots)
+
+            if self.executor:
+                await self.update_rooms_offloaded(due)
+            else:
                 # Update active rooms
-                for room in list(self.rooms.values()):
+                for room in due:
                     try:
                         await room.update()
                     except Exception as e:
-                        logger.error(f"Error updating room: {e}")
+                        logger.error("Error updating room: %s", e, extra={"room": room.game_id})
+
+            # Finished rooms already sent game over this tick
+            for room in due:
+                if room.is_finished:
+                    self.compact_room(room)
+        except Exception as e:
+            logger.error("Error in game loop: %s", e)
+
+    def compact_room(self, room: GameRoom):
+        """Replace a finished room with its result record and stop ticking it."""
+        self.results.record(room.result())
+        self.remove_room(room.game_id)
+        logger.info("Match recorded", extra={"room": room.game_id})
+
+    def start_executor(self):
+        gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+        if gil_enabled:
+            logger.warning("Simulation workers enabled on a GIL build, physics will not run in parallel")
+        self.executor = ThreadPoolExecutor(max_workers=self.simulation_workers, thread_name_prefix="simulation")
+        logger.info("Simulating rooms on %d worker threads", self.simulation_workers)
+
+    async def update_rooms_offloaded(self, due: List[GameRoom]):
+        """Update rooms with the simulation step partitioned across the worker threads.
+
+        Countdown handling, encoding and sending stay on the event loop; workers
+        only step the physics and hand back immutable snapshots to broadcast.
+        Inputs and joins arriving meanwhile are queued on the room, not applied.
+        """
+        rooms = []
+        for room in due:
+            try:
+                if await room.begin_update():
+                    rooms.append(room)
+                else:
+                    await room.flush()
             except Exception as e:
-                logger.error(f"Error in game loop: {e}")
-            await asyncio.sleep(1/60)
+                logger.error("Error updating room: %s", e, extra={"room": room.game_id})
+
+        for room in rooms:
+            room.simulating = True
+
+        loop = asyncio.get_running_loop()
+        partitions = [rooms[i::self.simulation_workers] for i in range(self.simulation_workers)]
+        results = await asyncio.gather(*(
+            loop.run_in_executor(self.executor, simulate_partition, partition)
+            for partition in partitions if partition
+        ))
+
+        for partition, snapshots in zip([p for p in partitions if p], results):
+            for room, snapshot in zip(partition, snapshots):
+                try:
+                    await room.finish_update(snapshot)
+                except Exception as e:
+                    logger.error("Error updating room: %s", e, extra={"room": room.game_id})
 
     async def stop(self):
         """Stop game loop and clean up resources."""
         self.is_running = False
         # Clean up all rooms
         for room_id in list(self.rooms.keys()):
-            del self.rooms[room_id]
+            self.remove_room(room_id)
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    async def drain(self, timeout: float = DRAIN_TIMEOUT, reconnect_url: str = RECONNECT_URL):
+        """Stop accepting new rooms, let running matches finish and migrate the rest.
+
+        Rooms without an active match are migrated right away. Matches still
+        running when the deadline passes are migrated as well.
+        """
+        self.draining = True
+        deadline = time.monotonic() + timeout
+        logger.info("Draining %d rooms (deadline %.0fs)", len(self.rooms), timeout)
+
+        while self.rooms:
+            deadline_passed = time.monotonic() >= deadline
+            for room in list(self.rooms.values()):
+                if deadline_passed or not room.has_active_match:
+                    await self.migrate_room(room, reconnect_url)
+            if deadline_passed:
+                break
+            await asyncio.sleep(DRAIN_POLL_INTERVAL)
+
+        logger.info("Drain complete")
+
+    async def migrate_room(self, room: GameRoom, reconnect_url: str):
+        delay_ms = int(random.uniform(0, RECONNECT_JITTER) * 1000)
+        await room.migrate(reconnect_url, delay_ms)
+        self.remove_room(room.game_id)
 
     def add_room(self, room):
         self.rooms[str(room.game_id)] = room
+        if room.bots:
+            self.bot_rooms[str(room.game_id)] = room
 
     def remove_room(self, game_id):
-        if str(game_id) in self.rooms:
-            del self.rooms[str(game_id)]
+        room = self.rooms.pop(str(game_id), None)
+        if room:
+            room.close()
+        self.bot_rooms.pop(str(game_id), None)
 
 game_loop = GameLoop()
\ No newline at end of file
@@ -1,14 +1,26 @@
 import time
-from dataclasses import dataclass
-from typing import Dict, Optional
+import uuid
+import zlib
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
 
 from fastapi import WebSocket
 from starlette.websockets import WebSocketDisconnect
 
+from core.bots import DIFFICULTIES, Bot
+from core.connection_registry import ConnectionRegistry, connection_registry
+from core.events import EventBus, event_bus
+from core.frame_export import FRAME_EXPORT_DIR, FrameRing, ring_path
+from core.results_store import MatchResult
 from domain.enums import GameState
-from domain.game import Game
+from domain.events import GameEvent, GoalScored, PlayerJoined, PlayerLeft, StateChanged
+from domain.fixed_point import FixedPointGame
+from domain.game import Game, GameSnapshot
 from logger import logger
-from networking.binary_protocol import encode_game_state, encode_game_status
+from networking.binary_protocol import (
+    GameUpdateType, encode_batch, encode_catch_up, encode_game_state, encode_game_status, encode_game_update,
+    encode_multi_ball_state, encode_reconnect
+)
 
 
 @dataclass
@@ -16,24 +28,136 @@ class Player:
     name: str
     uuid: str
     role: str
-    websocket: WebSocket
+    websocket: WebSocket | None  # None for bots
     connected: bool = True
+    is_bot: bool = False
+    last_seen: float = field(default_factory=time.monotonic)  # Last message received
+    rtt: float | None = None  # Smoothed round trip time in milliseconds
+    outbox: List[bytes] = field(default_factory=list)  # Messages for this player only, sent with the next flush
+
+
+TICK_RATES = {  # Simulation and broadcast rate in Hz per room class
+    "casual": 30,
+    "standard": 60,
+    "competitive": 120,
+}
+DEFAULT_ROOM_CLASS = "standard"
+PHYSICS_BACKENDS = ("float", "fixed")  # fixed: deterministic integer simulation, single ball only
+DEFAULT_PHYSICS = "float"
 
 
 class GameRoom:
     INACTIVE_TIMEOUT = 300  # 5 minutes in seconds
-
-    def __init__(self, game_id: str):
+    SERVICE_RESTART_CODE = 1012  # WebSocket close code for server restarts
+    MAX_TICK_DT = 0.25  # Cap on simulated time per tick after a stall
+    START_COUNTDOWN = 3.0  # Seconds between a full room and the start of play
+    STATE_KEEPALIVE = 1.0  # Seconds an unchanged state goes without being resent
+
+    def __init__(self, game_id: str, registry: ConnectionRegistry = connection_registry, bus: EventBus = event_bus,
+                 tick_rate: int = TICK_RATES[DEFAULT_ROOM_CLASS], balls: int = 1,
+                 physics: str = DEFAULT_PHYSICS, frame_export_dir: str = FRAME_EXPORT_DIR):
         # Game state
-        self.game_state = Game()
+        if physics == "fixed":
+            # Seeded from the room id, so a room replays identically
+            self.game_state = FixedPointGame(
+                seed=zlib.crc32(game_id.encode()),
+                steps_per_tick=max(round(1 / (tick_rate * Game.PHYSICS_STEP)), 1)
+            )
+            self.encode_state = encode_game_state
+        elif balls == 1:
+            self.game_state = Game()
+            self.encode_state = encode_game_state
+        else:
+            # NumPy is only loaded once a multi-ball room is created
+            from domain.multi_ball import MultiBallGame
+            self.game_state = MultiBallGame(balls=balls)
+            self.encode_state = encode_multi_ball_state
         self.game_state.room_id = game_id
         self.game_id = game_id
 
         # Room state
         self.players: Dict[str, Player] = {}  # uuid -> Player
+        self.bots: List[Bot] = []
+        self.outbox: List[bytes] = []  # Messages for all players, sent as one frame per player with the next flush
+        self.events: List[GameEvent] = []  # Room events since the last publish, simulation events live on the game
+        self.connected_count = 0
+        self.registry = registry
+        self.bus = bus
         self.starting = False
         self.game_start_timer = None
         self.last_activity = time.time()
+        self.started_at: float | None = None  # First tick in play
+
+        # A worker thread owns game_state while simulating, changes from the loop wait for the next tick
+        self.simulating = False
+        self.pending_changes: List[Callable[[], object]] = []
+
+        # Tick scheduling
+        self.tick_rate = tick_rate
+        self.tick_interval = 1 / tick_rate
+        self.next_tick = 0.0  # Monotonic time the next tick is due
+        self.last_tick: float | None = None
+        self.tick_dt = self.tick_interval  # Seconds simulated by the current tick
+
+        # Cost accounting, CPU seconds of the thread doing the work
+        self.ticks = 0
+        self.update_cpu_time = 0.0
+        self.broadcast_cpu_time = 0.0
+
+        # Last broadcast state, unchanged states are not sent again
+        self.last_snapshot: Optional[GameSnapshot] = None
+        self.state_frame = b""  # Encoded last_snapshot
+        self.state_sent_at = 0.0
+        self.state_frames_sent = 0
+        self.state_frames_skipped = 0
+
+        # Room frames mirrored to shared memory for relays in other processes
+        self.frame_ring: Optional[FrameRing] = None
+        if frame_export_dir:
+            try:
+                self.frame_ring = FrameRing(ring_path(frame_export_dir, game_id))
+            except OSError as e:
+                logger.error("Frame export unavailable: %s", e, extra={"room": game_id})
+
+    @property
+    def is_finished(self) -> bool:
+        return self.game_state.state == GameState.GAME_OVER
+
+    def result(self) -> MatchResult:
+        """Compact record of the match for the results history."""
+        players = {p.role: p for p in self.players.values()}
+        left, right = players.get("left"), players.get("right")
+        ended_at = time.time()
+        return MatchResult(
+            room_id=self.game_id,
+            left_uuid=left.uuid if left else None,
+            left_name=left.name if left else None,
+            right_uuid=right.uuid if right else None,
+            right_name=right.name if right else None,
+            left_score=self.game_state.left_score,
+            right_score=self.game_state.right_score,
+            winner=self.game_state.winner,
+            started_at=self.started_at,
+            ended_at=ended_at,
+            duration=ended_at - self.started_at if self.started_at else None,
+            left_hits=self.game_state.left_hits,
+            right_hits=self.game_state.right_hits
+        )
+
+    def cost_report(self) -> Dict:
+        return {
+            "id": self.game_id,
+            "state": self.game_state.state.value,
+            "tick_rate": self.tick_rate,
+            "ticks": self.ticks,
+            "update_cpu_ms": round(self.update_cpu_time * 1000, 3),
+            "broadcast_cpu_ms": round(self.broadcast_cpu_time * 1000, 3),
+            "state_frames_sent": self.state_frames_sent,
+            "state_frames_skipped": self.state_frames_skipped,
+        }
+
+    def is_due(self, now: float) -> bool:
+        return now >= self.next_tick
 
     @property
     def is_expired(self) -> bool:
@@ -42,6 +166,15 @@ class GameRoom:
         return (inactive_time > self.INACTIVE_TIMEOUT and
                 (self.game_state.state == GameState.GAME_OVER or not self.players))
 
+    @property
+    def connected_humans(self) -> List[Player]:
+        return [p for p in self.players.values() if p.connected and not p.is_bot]
+
+    @property
+    def has_active_match(self) -> bool:
+        """Check if a match is running or counting down with both players present"""
+        return self.starting or self.game_state.state == GameState.PLAYING
+
     async def connect(self, websocket: WebSocket, player_name: str, player_uuid: str) -> Optional[str]:
         """Connect a player to the game room."""
         self.last_activity = time.time()
@@ -50,141 +183,336 @@ class GameRoom:
         if player_uuid in self.players:
             player = self.players[player_uuid]
             if player.connected:
-                logger.warning(f"Room {self.game_id}: Duplicate connection rejected for {player_name}")
+                logger.warning("Duplicate connection rejected for %s", player_name,
+                               extra={"room": self.game_id, "player": player_uuid})
                 return None
 
             # Reconnect existing player
             player.websocket = websocket
             player.connected = True
-            self.game_state.add_player()
-
-            logger.info(f"Room {self.game_id}: Player {player_name} reconnected as {player.role}")
-            await self.broadcast_game_status("player_reconnected")
+            player.last_seen = time.monotonic()
+            self.connected_count += 1
+            self.registry.register(self, player)
+            self.change_game(self.game_state.add_player)
+            self.events.append(PlayerJoined(player_uuid, player_name, player.role, reconnected=True))
             return player.role
 
         # Check room capacity
-        connected_count = len([p for p in self.players.values() if p.connected])
-        if connected_count >= 2:
-            logger.warning(f"Room {self.game_id}: Connection rejected - room is full")
+        if self.connected_count >= 2:
+            logger.warning("Connection rejected - room is full", extra={"room": self.game_id, "player": player_uuid})
             return None
 
-        # Assign role for new player
-        existing_roles = {p.role for p in self.players.values() if p.connected}
-        role = 'left' if 'left' not in existing_roles else 'right'
-
         # Add new player
-        self.players[player_uuid] = Player(
+        role = self.free_role()
+        player = Player(
             name=player_name,
             uuid=player_uuid,
             role=role,
             websocket=websocket
         )
-        self.game_state.add_player()
+        self.players[player_uuid] = player
+        self.connected_count += 1
+        self.registry.register(self, player)
+        self.change_game(self.game_state.add_player)
+        self.events.append(PlayerJoined(player_uuid, player_name, role, reconnected=False))
+        return role
+
+    def free_role(self) -> str:
+        existing_roles = {p.role for p in self.players.values() if p.connected}
+        return 'left' if 'left' not in existing_roles else 'right'
+
+    def add_bot(self, difficulty: str) -> Optional[str]:
+        """Seat a server-side bot in place of a player, returns its role."""
+        if self.connected_count >= 2 or difficulty not in DIFFICULTIES:
+            return None
+
+        role = self.free_role()
+        bot = Player(
+            name=f"Bot ({difficulty})",
+            uuid=f"bot-{uuid.uuid4()}",
+            role=role,
+            websocket=None,
+            is_bot=True
+        )
+        self.players[bot.uuid] = bot
+        self.bots.append(Bot(role, DIFFICULTIES[difficulty]))
+        self.connected_count += 1
+        self.change_game(self.game_state.add_player)
 
-        logger.info(f"Room {self.game_id}: Player {player_name} connected as {role}")
-        await self.broadcast_game_status("waiting_for_players")
+        logger.info("Bot seated", extra={"room": self.game_id, "player": bot.uuid, "role": role})
         return role
 
+    def get_player(self, websocket: WebSocket) -> Optional[Player]:
+        connection = self.registry.get(websocket)
+        if connection and connection.room is self:
+            return connection.player
+        return None
+
     def disconnect(self, websocket: WebSocket) -> None:
         """Disconnect a player."""
         self.last_activity = time.time()
 
         # Find player by websocket
-        player = next((p for p in self.players.values() if p.websocket == websocket), None)
-        if not player:
+        player = self.get_player(websocket)
+        if not player or not player.connected:
             return
 
         player.connected = False
-        self.game_state.remove_player()
-        logger.info(f"Room {self.game_id}: Player {player.name} ({player.role}) disconnected")
+        player.outbox.clear()  # Stale session messages must not reach the next connection
+        self.connected_count -= 1
+        self.registry.unregister(websocket)
+        self.change_game(self.game_state.remove_player)
+        self.events.append(PlayerLeft(player.uuid, player.name, player.role))
 
         # Update game state if needed
-        connected_count = len([p for p in self.players.values() if p.connected])
-        if connected_count < 2:
-            self.game_state.state = GameState.PAUSED
-            logger.info(f"Room {self.game_id}: Game paused")
+        if self.connected_count < 2:
+            self.change_game(lambda: self.game_state.set_state(GameState.PAUSED))
+
+    def change_game(self, change: Callable[[], object]) -> None:
+        """Apply a change to the game state from the event loop.
+
+        While a worker thread simulates the room the change is queued instead,
+        and queued changes are applied in order at the start of the next tick.
+        """
+        if self.simulating or self.pending_changes:
+            self.pending_changes.append(change)
+        else:
+            change()
+
+    def apply_pending_changes(self) -> None:
+        changes = self.pending_changes
+        self.pending_changes = []
+        for change in changes:
+            change()
 
     async def update(self) -> None:
         """Update game state and handle game progression."""
+        if await self.begin_update():
+            await self.finish_update(self.simulate())
+        else:
+            await self.flush()
+
+    async def begin_update(self) -> bool:
+        """Handle game start and countdown, returns whether the simulation should step."""
         self.last_activity = time.time()
-        previous_state = self.game_state.state
-        connected_count = len([p for p in self.players.values() if p.connected])
+        self.ticks += 1
+        self.schedule_tick()
+        self.apply_pending_changes()
 
         # Handle game start when room is full
-        if connected_count == 2 and self.game_state.state == GameState.WAITING:
+        if self.connected_count == 2 and self.game_state.state == GameState.WAITING:
             if not self.starting:
                 self.starting = True
                 self.game_start_timer = time.time()
-                logger.info(f"Room {self.game_id}: Game starting")
-                await self.broadcast_game_status("game_starting")
+                logger.info("Game starting", extra={"room": self.game_id})
+                self.queue_game_status("game_starting")
 
         # Handle countdown and game start
         if self.starting:
             elapsed = time.time() - self.game_start_timer
-            if elapsed >= 3:  # 3 second countdown
+            if elapsed >= self.START_COUNTDOWN:
                 self.starting = False
-                self.game_state.state = GameState.PLAYING
-                await self.broadcast_game_status("game_in_progress")
-            return  # Don't update game state during countdown
+                self.game_state.set_state(GameState.PLAYING)
+            return False  # Don't update game state during countdown
+
+        return True
+
+    def schedule_tick(self) -> None:
+        """Measure the time since the last tick and schedule the next one."""
+        now = time.monotonic()
+        if self.last_tick is not None:
+            self.tick_dt = min(now - self.last_tick, self.MAX_TICK_DT)
+        self.last_tick = now
 
+        self.next_tick += self.tick_interval
+        if self.next_tick < now:
+            # Fell behind by more than a tick, restart the cadence from now
+            self.next_tick = now + self.tick_interval
+
+    def simulate(self) -> Optional[GameSnapshot]:
+        """Step the simulation, safe to run off the event loop.
+
+        Returns a snapshot of the state to broadcast, or None if not playing.
+        """
         # Update game state only if playing
         if self.game_state.state == GameState.PLAYING:
-            self.game_state.update()
+            if self.started_at is None:
+                self.started_at = time.time()
+            started = time.thread_time()
+            self.game_state.update(self.tick_dt)
+            self.update_cpu_time += time.thread_time() - started
 
-        # Handle state transitions
-        if self.game_state.state == GameState.PLAYING and previous_state != GameState.PLAYING:
-            await self.broadcast_game_status("game_in_progress")
-        elif self.game_state.state == GameState.PAUSED and previous_state != GameState.PAUSED:
-            await self.broadcast_game_status("game_paused")
-        elif self.game_state.state == GameState.GAME_OVER and previous_state != GameState.GAME_OVER:
-            await self.broadcast_game_status(f"game_over_{self.game_state.winner}")
+        if self.game_state.state == GameState.PLAYING:
+            return self.game_state.snapshot()
+        return None
+
+    async def finish_update(self, snapshot: Optional[GameSnapshot]) -> None:
+        """Queue the events of the step and the simulated state, then send them as one frame per player."""
+        self.simulating = False
+        self.publish_events()
 
         # Only broadcast state if game is playing
-        if self.game_state.state == GameState.PLAYING:
-            await self.broadcast_state()
+        if snapshot is not None:
+            self.queue_state(snapshot)
 
-    async def broadcast_state(self) -> None:
-        """Broadcast game state to all connected players."""
+        await self.flush()
+
+    def publish_events(self) -> None:
+        """Hand the events buffered since the last publish to the bus subscribers."""
+        if not self.game_state.events and not self.events:
+            return
+        # Room events first, joins and leaves come before the state changes they cause
+        events = self.events + self.game_state.events
+        self.game_state.events = []
+        self.events = []
+        self.bus.publish(self, events)
+
+    def catch_up(self) -> bytes:
+        """Full room state in one message, for a player resuming their seat."""
+        if self.starting:
+            delay = max(self.START_COUNTDOWN - (time.time() - self.game_start_timer), 0.0)
+        else:
+            delay = self.game_state.pending_delay()
+        return encode_catch_up(
+            self.game_state.state,
+            self.connected_count,
+            self.game_state.left_score,
+            self.game_state.right_score,
+            self.game_state.winner,
+            min(round(delay * 1000), 0xFFFF),
+            self.encode_state(*self.game_state.snapshot())
+        )
+
+    def queue_state(self, snapshot: Optional[GameSnapshot] = None) -> None:
+        """Queue game state for all connected players if it changed since the last broadcast.
+
+        An unchanged state, e.g. during the start and score delays, is only
+        resent every STATE_KEEPALIVE seconds, reusing the encoded frame.
+        """
         if not self.players or self.game_state.state != GameState.PLAYING:
             return
 
-        state_bytes = encode_game_state(
-            self.game_state.ball.x,
-            self.game_state.ball.y,
-            self.game_state.left_paddle.y_position,
-            self.game_state.right_paddle.y_position,
+        snapshot = snapshot or self.game_state.snapshot()
+        now = time.monotonic()
+        if snapshot != self.last_snapshot:
+            self.last_snapshot = snapshot
+            self.state_frame = self.encode_state(*snapshot)
+        elif now - self.state_sent_at < self.STATE_KEEPALIVE:
+            self.state_frames_skipped += 1
+            return
+
+        self.state_sent_at = now
+        self.state_frames_sent += 1
+        self.outbox.append(self.state_frame)
+
+    def queue_game_status(self, status: str) -> None:
+        """Queue game status for all connected players."""
+        logger.debug("Broadcasting status - %s", status, extra={"room": self.game_id})
+        self.outbox.append(encode_game_status(status))
+
+    def queue_game_update(self, update_type: GameUpdateType) -> None:
+        """Queue a game update for all connected players."""
+        self.outbox.append(encode_game_update(
+            update_type,
+            uuid.UUID(self.game_id),
+            self.game_state.state,
+            self.connected_count,
             self.game_state.left_score,
             self.game_state.right_score,
             self.game_state.winner
-        )
-
+        ))
+
+    async def flush(self) -> None:
+        """Send queued messages with at most one frame per player.
+
+        Only the encoding before the sends is charged to broadcast_cpu_time,
+        other coroutines run while the sends are awaited.
+        """
+        started = time.thread_time()
+        self.publish_events()
+        frames = self.encode_outbox()
+        self.broadcast_cpu_time += time.thread_time() - started
+        if frames:
+            await self.send_frames(frames)
+
+    def encode_outbox(self) -> List[Tuple[Player, bytes]]:
+        """Batch the room and player messages into one frame per connected player."""
+        room_messages = self.outbox
+        self.outbox = []
+        room_frame = encode_batch(room_messages) if room_messages else None
+        if room_frame is not None and self.frame_ring:
+            self.frame_ring.publish(room_frame)
+
+        frames = []
+        for player in self.connected_humans:
+            if player.outbox:
+                frames.append((player, encode_batch(player.outbox + room_messages)))
+                player.outbox.clear()
+            elif room_frame is not None:
+                frames.append((player, room_frame))
+        return frames
+
+    async def send_frames(self, frames: List[Tuple[Player, bytes]]) -> None:
         disconnected_players = set()
-        for player in [p for p in self.players.values() if p.connected]:
+        for player, frame in frames:
             try:
-                await player.websocket.send_bytes(state_bytes)
+                await player.websocket.send_bytes(frame)
             except (WebSocketDisconnect, RuntimeError):
                 disconnected_players.add(player.uuid)
-                logger.warning(f"Room {self.game_id}: Player {player.name} disconnected during state broadcast")
+                logger.warning("Player %s disconnected during broadcast", player.name,
+                               extra={"room": self.game_id, "player": player.uuid})
 
         # Handle any disconnections
         for player_uuid in disconnected_players:
             if player_uuid in self.players:
                 self.disconnect(self.players[player_uuid].websocket)
 
-    async def broadcast_game_status(self, status: str) -> None:
-        """Broadcast game status to all connected players."""
-        logger.debug(f"Room {self.game_id}: Broadcasting status - {status}")
-        status_bytes = encode_game_status(status)
-        disconnected_players = set()
+    async def migrate(self, reconnect_url: str, delay_ms: int = 0) -> None:
+        """Tell connected players where to reconnect and close their connections."""
+        reconnect_bytes = encode_reconnect(reconnect_url, delay_ms)
 
-        for player in [p for p in self.players.values() if p.connected]:
+        for player in self.connected_humans:
             try:
-                await player.websocket.send_bytes(status_bytes)
-            except WebSocketDisconnect:
-                disconnected_players.add(player.uuid)
-                logger.warning(f"Room {self.game_id}: Player {player.name} disconnected during status broadcast")
+                await player.websocket.send_bytes(reconnect_bytes)
+                await player.websocket.close(code=self.SERVICE_RESTART_CODE, reason="Server restarting")
+            except (WebSocketDisconnect, RuntimeError):
+                pass  # WebSocket already closed
+            self.disconnect(player.websocket)
 
-        # Handle any disconnections
-        for player_uuid in disconnected_players:
-            if player_uuid in self.players:
-                self.disconnect(self.players[player_uuid].websocket)
\ No newline at end of file
+        logger.info("Migrated players (reconnect in %d ms)", delay_ms, extra={"room": self.game_id})
+
+    def close(self) -> None:
+        """Release what the room holds outside the process once it is removed."""
+        if self.frame_ring:
+            self.frame_ring.close()
+            self.frame_ring = None
+
+
+def broadcast_state_changes(room: GameRoom, events: List[StateChanged]) -> None:
+    for event in events:
+        if event.current == GameState.PLAYING:
+            room.queue_game_status("game_in_progress")
+        elif event.current == GameState.PAUSED:
+            room.queue_game_status("game_paused")
+        elif event.current == GameState.GAME_OVER:
+            room.queue_game_status(f"game_over_{room.game_state.winner}")
+            room.queue_game_update(GameUpdateType.GAME_OVER)
+
+
+def broadcast_goals(room: GameRoom, _: List[GoalScored]) -> None:
+    # One score update carries the latest score for all goals of the tick
+    room.queue_game_update(GameUpdateType.SCORE_UPDATE)
+
+
+def broadcast_joins(room: GameRoom, events: List[PlayerJoined]) -> None:
+    for event in events:
+        if event.reconnected:
+            room.queue_game_status("player_reconnected")
+        else:
+            room.queue_game_status("waiting_for_players")
+            room.queue_game_update(GameUpdateType.PLAYER_JOINED)
+
+
+event_bus.subscribe(StateChanged, broadcast_state_changes)
+event_bus.subscribe(GoalScored, broadcast_goals)
+event_bus.subscribe(PlayerJoined, broadcast_joins)
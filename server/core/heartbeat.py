@@ -0,0 +1,73 @@
+import asyncio
+import time
+
+from starlette.websockets import WebSocketDisconnect
+
+from core.connection_registry import ConnectionRegistry, connection_registry
+from core.game_room import Player
+from logger import logger
+from networking.binary_protocol import encode_ping
+
+HEARTBEAT_INTERVAL = 2.0  # Seconds between pings
+DEAD_PEER_TIMEOUT = 6.0  # Seconds without any message before a peer is evicted
+CLOSE_TIMEOUT = 1.0  # Seconds to wait for the close frame on a dead connection
+GOING_AWAY_CODE = 1001
+RTT_SMOOTHING = 0.2  # Weight of a new sample in the smoothed RTT
+
+
+def ping_token() -> int:
+    """Millisecond clock token, echoed back by the client to measure RTT."""
+    return int(time.monotonic() * 1000) & 0xFFFFFFFF
+
+
+def record_heartbeat(player: Player, token: int | None) -> None:
+    """Update the smoothed RTT of a player from an echoed ping token."""
+    if token is None:
+        return
+    sample = (ping_token() - token) & 0xFFFFFFFF
+    if player.rtt is None:
+        player.rtt = float(sample)
+    else:
+        player.rtt += RTT_SMOOTHING * (sample - player.rtt)
+
+
+class HeartbeatMonitor:
+    def __init__(self, registry: ConnectionRegistry):
+        self.registry = registry
+        self.is_running = True
+
+    async def run(self):
+        while self.is_running:
+            try:
+                await self.tick()
+            except Exception as e:
+                logger.error("Error in heartbeat monitor: %s", e)
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+
+    async def stop(self):
+        self.is_running = False
+
+    async def tick(self):
+        """Ping every connected player and evict the ones that went silent."""
+        now = time.monotonic()
+        ping_bytes = encode_ping(ping_token())
+
+        for connection in self.registry:
+            player = connection.player
+            if now - player.last_seen > DEAD_PEER_TIMEOUT:
+                logger.warning("Evicting dead peer %s", player.name,
+                               extra={"room": connection.room.game_id, "player": player.uuid, "role": player.role})
+                try:
+                    await asyncio.wait_for(
+                        self.registry.kick(player.uuid, GOING_AWAY_CODE, "Heartbeat timeout"), CLOSE_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    pass  # Peer is gone, the receive loop cleans up
+                continue
+            try:
+                await player.websocket.send_bytes(ping_bytes)
+            except (WebSocketDisconnect, RuntimeError):
+                connection.room.disconnect(player.websocket)
+
+
+heartbeat_monitor = HeartbeatMonitor(connection_registry)
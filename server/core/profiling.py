@@ -0,0 +1,81 @@
+import asyncio
+import cProfile
+import io
+import marshal
+import os
+import pstats
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+SAMPLE_INTERVAL = 0.005  # Seconds between stack samples
+TRACEMALLOC_FRAMES = 25
+TOP_ENTRIES = 50
+
+capture_lock = asyncio.Lock()  # Profilers hook the interpreter globally, one capture at a time
+
+
+async def capture_cprofile(seconds: float) -> tuple[bytes, str]:
+    """Profile the event loop thread, which runs the game loop, for a time box.
+
+    Returns the stats in pstats dump format and a text summary.
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        profiler.disable()
+
+    profiler.create_stats()
+    dump = marshal.dumps(profiler.stats)  # Read before pstats takes the stats over
+    summary = io.StringIO()
+    pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(TOP_ENTRIES)
+    return dump, summary.getvalue()
+
+
+def sample_stacks(thread_id: int, seconds: float, interval: float) -> Counter:
+    """Sample the stack of a thread and count collapsed stacks, runs on a helper thread."""
+    stacks = Counter()
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        frame = sys._current_frames().get(thread_id)
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+            frame = frame.f_back
+        if names:
+            stacks[";".join(reversed(names))] += 1
+        time.sleep(interval)
+    return stacks
+
+
+async def capture_samples(seconds: float, interval: float = SAMPLE_INTERVAL) -> str:
+    """Sampling profile of the event loop thread in collapsed stack format (flame graph input)."""
+    stacks = await asyncio.to_thread(sample_stacks, threading.get_ident(), seconds, interval)
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+async def capture_tracemalloc(seconds: float) -> tuple[bytes, str]:
+    """Trace allocations for a time box.
+
+    Returns the snapshot in tracemalloc dump format and the top allocation sites.
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+    try:
+        await asyncio.sleep(seconds)
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+    summary = "".join(f"{stat}\n" for stat in snapshot.statistics("lineno")[:TOP_ENTRIES])
+    with tempfile.NamedTemporaryFile(suffix=".tracemalloc") as dump:
+        snapshot.dump(dump.name)
+        return dump.read(), summary
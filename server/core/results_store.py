@@ -0,0 +1,155 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, List, Optional
+
+from logger import logger
+
+RESULTS_DB = os.getenv("RESULTS_DB", "results.db")
+BATCH_SIZE = 100  # Results written per transaction at most
+FLUSH_INTERVAL = 2.0  # Seconds a result may wait before its batch is written
+QUEUE_SIZE = 10_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    room_id TEXT NOT NULL,
+    left_uuid TEXT,
+    left_name TEXT,
+    right_uuid TEXT,
+    right_name TEXT,
+    left_score INTEGER NOT NULL,
+    right_score INTEGER NOT NULL,
+    winner TEXT,
+    started_at REAL,
+    ended_at REAL NOT NULL,
+    duration REAL,
+    left_hits INTEGER NOT NULL,
+    right_hits INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS matches_ended_at ON matches (ended_at DESC);
+CREATE INDEX IF NOT EXISTS matches_left_uuid ON matches (left_uuid, ended_at DESC);
+CREATE INDEX IF NOT EXISTS matches_right_uuid ON matches (right_uuid, ended_at DESC);
+"""
+
+PLAYER_STATS = """
+SELECT COUNT(*) AS matches,
+       COALESCE(SUM(won), 0) AS wins,
+       COALESCE(SUM(points_for), 0) AS points_for,
+       COALESCE(SUM(points_against), 0) AS points_against,
+       COALESCE(SUM(hits), 0) AS hits,
+       MAX(ended_at) AS last_played
+FROM (
+    SELECT winner = 'left' AS won, left_score AS points_for, right_score AS points_against,
+           left_hits AS hits, ended_at
+    FROM matches WHERE left_uuid = :uuid
+    UNION ALL
+    SELECT winner = 'right', right_score, left_score, right_hits, ended_at
+    FROM matches WHERE right_uuid = :uuid
+)
+"""
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    """Compact record of a finished match."""
+    room_id: str
+    left_uuid: Optional[str]
+    left_name: Optional[str]
+    right_uuid: Optional[str]
+    right_name: Optional[str]
+    left_score: int
+    right_score: int
+    winner: Optional[str]
+    started_at: Optional[float]
+    ended_at: float
+    duration: Optional[float]
+    left_hits: int
+    right_hits: int
+
+
+COLUMNS = [f.name for f in fields(MatchResult)]
+INSERT = f"INSERT INTO matches ({', '.join(COLUMNS)}) VALUES ({', '.join(':' + c for c in COLUMNS)})"
+
+
+class ResultsStore:
+    """SQLite store of finished matches with write-behind batching.
+
+    record() only enqueues; a background thread writes batches in single
+    transactions, so the game loop never waits on disk.
+    """
+
+    def __init__(self, path: str = RESULTS_DB):
+        self.path = path
+        self.queue: queue.Queue[Optional[MatchResult]] = queue.Queue(QUEUE_SIZE)
+        self.thread: Optional[threading.Thread] = None
+        self.dropped = 0
+
+    def connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def start(self) -> None:
+        with closing(self.connect()) as connection, connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+        self.thread = threading.Thread(target=self.writer, name="results-writer", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Flush pending results and stop the writer thread."""
+        if self.thread:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+
+    def record(self, result: MatchResult) -> None:
+        try:
+            self.queue.put_nowait(result)
+        except queue.Full:
+            self.dropped += 1
+            logger.warning("Results queue full, dropping match result", extra={"room": result.room_id})
+
+    def writer(self) -> None:
+        connection = self.connect()
+        running = True
+        while running:
+            batch = []
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            while len(batch) < BATCH_SIZE:
+                try:
+                    result = self.queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if result is None:
+                    running = False
+                    break
+                batch.append(asdict(result))
+
+            if batch:
+                try:
+                    with connection:
+                        connection.executemany(INSERT, batch)
+                except sqlite3.Error as e:
+                    logger.error("Error writing %d match results: %s", len(batch), e)
+        connection.close()
+
+    def recent_matches(self, limit: int) -> List[Dict]:
+        with closing(self.connect()) as connection, connection:
+            rows = connection.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM matches ORDER BY ended_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def player_stats(self, player_uuid: str) -> Dict:
+        with closing(self.connect()) as connection, connection:
+            row = connection.execute(PLAYER_STATS, {"uuid": player_uuid}).fetchone()
+        return {"uuid": player_uuid, **dict(row)}
+
+
+results_store = ResultsStore()
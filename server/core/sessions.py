@@ -0,0 +1,37 @@
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import time
+from typing import Optional
+
+# Shared secret for resume tokens, set it on every instance that should accept
+# each other's tokens. A random secret only accepts tokens of this process.
+RESUME_SECRET = os.getenv("RESUME_SECRET", "").encode() or secrets.token_bytes(32)
+RESUME_TOKEN_TTL = int(os.getenv("RESUME_TOKEN_TTL", "3600"))  # Seconds a token is valid, longer than a match
+MAC_SIZE = 16
+
+
+def sign(room_id: str, player_uuid: str, expires: int) -> str:
+    mac = hmac.digest(RESUME_SECRET, f"{room_id}:{player_uuid}:{expires}".encode(), hashlib.sha256)[:MAC_SIZE]
+    return base64.urlsafe_b64encode(mac).decode().rstrip("=")
+
+
+def issue_resume_token(room_id: str, player_uuid: str, now: float | None = None) -> str:
+    """Token that lets a player resume their seat with only their uuid, until it expires."""
+    expires = int(now if now is not None else time.time()) + RESUME_TOKEN_TTL
+    return f"{room_id}.{expires}.{sign(room_id, player_uuid, expires)}"
+
+
+def verify_resume_token(token: str, player_uuid: str, now: float | None = None) -> Optional[str]:
+    """Return the room id of a valid, unexpired resume token, None otherwise."""
+    room_id, _, rest = token.partition(".")
+    expires, _, mac = rest.partition(".")
+    if not room_id or not expires.isdigit():
+        return None
+    if not hmac.compare_digest(mac, sign(room_id, player_uuid, int(expires))):
+        return None
+    if int(expires) <= (now if now is not None else time.time()):
+        return None
+    return room_id
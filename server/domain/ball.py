@@ -1,5 +1,6 @@
+import math
+import random
 from dataclasses import dataclass
-import numpy as np
 
 from domain.enums import GameSide
 
@@ -15,41 +16,41 @@ class Ball:
 
     def __post_init__(self):
         if self.speed is None:
-            self.speed = 1/60 * 1/2  # Default speed if not set by Game
+            self.speed = 0.5  # Default speed per second if not set by Game
 
     def set_speed(self, new_speed: float) -> None:
         self.speed = new_speed
 
     def normalize_angle(self, angle) -> float:
-        return np.mod(angle, 2 * np.pi)
+        return angle % (2 * math.pi)
 
-    def update_position(self) -> None:
-        self.x, self.y = self.calc_pos()
+    def update_position(self, dt: float) -> None:
+        self.x, self.y = self.calc_pos(dt)
 
         # Bounce off top and bottom
         if (
-                ((self.y <= self.radius) and (np.pi <= self.angle <= 2 * np.pi)) or
-                ((self.y >= 1 - self.radius) and (0 <= self.angle <= np.pi))
+                ((self.y <= self.radius) and (math.pi <= self.angle <= 2 * math.pi)) or
+                ((self.y >= 1 - self.radius) and (0 <= self.angle <= math.pi))
         ):
             self.angle = self.normalize_angle(-self.angle)
 
-    def calc_pos(self):
-        v_x = self.speed * np.cos(self.angle)
-        v_y = self.speed * np.sin(self.angle)
+    def calc_pos(self, dt: float):
+        v_x = self.speed * math.cos(self.angle)
+        v_y = self.speed * math.sin(self.angle)
 
-        x = self.x + v_x
-        y = self.y + v_y
+        x = self.x + v_x * dt
+        y = self.y + v_y * dt
 
         return x, y
 
     def set_direction(self, direction: GameSide = None) -> None:
         if direction == GameSide.LEFT:
-            self.angle = np.pi  # Towards left
+            self.angle = math.pi  # Towards left
         elif direction == GameSide.RIGHT:
             self.angle = 0  # Towards right
         else:
             # Random first serve
-            self.angle = np.random.choice([0, np.pi])
+            self.angle = random.choice([0, math.pi])
 
     def reset(self, direction: GameSide = None) -> None:
         self.x = 0.5
@@ -58,4 +59,4 @@ class Ball:
             self.set_direction()
             self.first_serve = False
         else:
-            self.set_direction(direction)
\ No newline at end of file
+            self.set_direction(direction)
@@ -0,0 +1,36 @@
+from typing import NamedTuple, Union
+
+from domain.enums import GameSide, GameState
+
+
+class GoalScored(NamedTuple):
+    scorer: GameSide
+    left_score: int
+    right_score: int
+
+
+# No subscriber yet, kept for observers such as metrics or match recording
+class PaddleHit(NamedTuple):
+    side: GameSide
+    rally_hits: int  # Hits of the ball since it was served
+
+
+class StateChanged(NamedTuple):
+    previous: GameState
+    current: GameState
+
+
+class PlayerJoined(NamedTuple):
+    player: str  # Player uuid
+    name: str
+    role: str
+    reconnected: bool
+
+
+class PlayerLeft(NamedTuple):
+    player: str
+    name: str
+    role: str
+
+
+GameEvent = Union[GoalScored, PaddleHit, StateChanged, PlayerJoined, PlayerLeft]
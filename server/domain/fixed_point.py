@@ -0,0 +1,271 @@
+import math
+import random
+import struct
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable, Iterable, List, NamedTuple
+
+from domain.ball import Ball
+from domain.enums import GameState, GameSide
+from domain.events import GoalScored, PaddleHit
+from domain.game import Game, GameSnapshot
+from domain.paddle import Paddle
+
+ONE = 1 << 20  # Fixed-point units per screen width and height
+HALF = ONE // 2
+DIRECTION_SCALE = 1 << 14  # Fixed-point scale of the direction table
+
+# Unit vectors (cos, sin) of the bounce angles from -pi/3 to pi/3 in 32 equal
+# steps, pre-rounded so no float math is involved in the simulation
+DIRECTIONS = (
+    (8192, -14189), (9102, -13623), (9974, -12998), (10803, -12318),
+    (11585, -11585), (12318, -10803), (12998, -9974), (13623, -9102),
+    (14189, -8192), (14694, -7246), (15137, -6270), (15515, -5266),
+    (15826, -4240), (16069, -3196), (16244, -2139), (16349, -1072),
+    (16384, 0), (16349, 1072), (16244, 2139), (16069, 3196),
+    (15826, 4240), (15515, 5266), (15137, 6270), (14694, 7246),
+    (14189, 8192), (13623, 9102), (12998, 9974), (12318, 10803),
+    (11585, 11585), (10803, 12318), (9974, 12998), (9102, 13623),
+    (8192, 14189),
+)
+
+# Step, ball x, y, vx, vy, paddle ys, scores
+FIXED_STATE = struct.Struct('!IiiiiiiBB')
+
+
+def to_fixed(value: float) -> int:
+    return round(value * ONE)
+
+
+class ReplayInput(NamedTuple):
+    """Input applied before the given step: a paddle move in units for "left"/"right", or "start" for a start delay"""
+    step: int
+    kind: str
+    units: int
+
+
+class FixedPointPaddle(Paddle):
+    """Paddle whose position is kept in fixed-point units."""
+
+    def __init__(self, x_pos: float):
+        super().__init__(x_pos)
+        self.y = to_fixed(self.INITIAL_Y)
+        self.x = to_fixed(x_pos)
+        self.half_height = to_fixed(self.h)
+        self.half_width = to_fixed(self.width / 2)
+        self.on_move: Callable[[int], None] | None = None  # Called with every move, for the input log
+
+    @property
+    def y_position(self) -> float:
+        return self.y / ONE
+
+    @y_position.setter
+    def y_position(self, value: float) -> None:
+        self.y = to_fixed(value)
+
+    def move_up(self, dt: float = Paddle.INPUT_INTERVAL) -> None:
+        self.move(-to_fixed(self.speed * dt))
+
+    def move_down(self, dt: float = Paddle.INPUT_INTERVAL) -> None:
+        self.move(to_fixed(self.speed * dt))
+
+    def move(self, units: int) -> None:
+        self.y = min(max(self.y + units, self.half_height), ONE - self.half_height)
+        if self.on_move:
+            self.on_move(units)
+
+
+@dataclass
+class FixedPointGame(Game):
+    """Game backend simulating in integer fixed-point units.
+
+    Positions and velocities are integers, the start and score delays are
+    counted in physics steps and every room tick advances the same number of
+    steps, so the same seed and the same inputs at the same steps give
+    bit-exact results on every run and machine. Inputs are logged with their
+    step for replay(). Positions stay below 2**24 units, so they are exact in
+    the float32 state message.
+    """
+    BASE_STEP = HALF // 120  # BASE_SPEED in units per PHYSICS_STEP
+    START_STEPS = round(Game.START_DELAY / Game.PHYSICS_STEP)
+    SCORE_STEPS = round(Game.SCORE_DELAY / Game.PHYSICS_STEP)
+
+    left_paddle: Paddle = field(default_factory=lambda: FixedPointPaddle(Game.LEFT_PADDLE_X))
+    right_paddle: Paddle = field(default_factory=lambda: FixedPointPaddle(Game.RIGHT_PADDLE_X))
+    seed: int = 0
+    steps_per_tick: int = 2  # Physics steps per room tick, 2 at 60 Hz
+    steps: int = 0  # Physics steps simulated
+    x: int = HALF
+    y: int = HALF
+    vx: int = 0  # Velocity in units per physics step
+    vy: int = 0
+    wait_steps: int = 0  # Steps until the next serve
+    serve_side: GameSide | None = None
+
+    def __post_init__(self):
+        self.rng = random.Random(self.seed)
+        self.radius = to_fixed(self.ball.radius)
+        self.inputs: List[ReplayInput] = []
+        self.left_paddle.on_move = partial(self.record_input, "left")
+        self.right_paddle.on_move = partial(self.record_input, "right")
+
+    @classmethod
+    def replay(cls, seed: int, inputs: Iterable[ReplayInput], steps: int) -> "FixedPointGame":
+        """Simulate a match again from its seed and input log, up to the given step."""
+        game = cls(seed=seed)
+        game.player_count = 2
+        game.state = GameState.PLAYING
+        pending = iter(sorted(inputs, key=lambda i: i.step))
+        next_input = next(pending, None)
+        while True:
+            while next_input and next_input.step == game.steps:
+                game.apply_input(next_input)
+                next_input = next(pending, None)
+            if game.steps >= steps or game.winner:
+                return game
+            game.step()
+
+    def record_input(self, kind: str, units: int) -> None:
+        self.inputs.append(ReplayInput(self.steps, kind, units))
+
+    def apply_input(self, replay_input: ReplayInput) -> None:
+        if replay_input.kind == "start":
+            self.start_delay()
+        else:
+            paddle = self.left_paddle if replay_input.kind == "left" else self.right_paddle
+            paddle.move(replay_input.units)
+
+    def add_player(self) -> None:
+        super().add_player()
+        if self.starting_state:
+            # The start delay is counted in steps, not timed like the float game
+            self.starting_state = False
+            self.start_delay()
+
+    def start_delay(self) -> None:
+        """Random first serve after the start delay."""
+        self.wait_steps = self.START_STEPS
+        self.serve_side = None
+        self.record_input("start", 0)
+
+    def update(self, dt: float = 1/60) -> None:
+        """Advance steps_per_tick steps, dt is ignored so that wall clock jitter does not change the steps."""
+        if self.winner or self.state != GameState.PLAYING or self.player_count < 2:
+            return
+
+        for _ in range(self.steps_per_tick):
+            self.step()
+            if self.winner:
+                break
+
+    def step(self) -> None:
+        self.steps += 1
+        if self.wait_steps:
+            self.wait_steps -= 1
+            if not self.wait_steps:
+                self.serve(self.serve_side)
+            return
+
+        self.x += self.vx
+        self.y += self.vy
+
+        # Bounce off top and bottom
+        if (self.y <= self.radius and self.vy < 0) or (self.y >= ONE - self.radius and self.vy > 0):
+            self.vy = -self.vy
+
+        # Check for scoring
+        if self.x <= 0:
+            self.handle_scoring(GameSide.LEFT, self.right_score + 1)
+            return
+        if self.x >= ONE:
+            self.handle_scoring(GameSide.RIGHT, self.left_score + 1)
+            return
+
+        # Paddle collisions, only for the ball moving towards the paddle
+        if self.vx < 0 and self.on_paddle(self.left_paddle):
+            self.left_hits += 1
+            self.bounce_off(self.left_paddle, 1)
+            self.events.append(PaddleHit(GameSide.LEFT, self.paddle_hits))
+        elif self.vx > 0 and self.on_paddle(self.right_paddle):
+            self.right_hits += 1
+            self.bounce_off(self.right_paddle, -1)
+            self.events.append(PaddleHit(GameSide.RIGHT, self.paddle_hits))
+
+    def serve(self, side: GameSide | None) -> None:
+        if side is None:
+            # Random first serve, from the seeded generator
+            side = self.rng.choice([GameSide.LEFT, GameSide.RIGHT])
+        self.x = self.y = HALF
+        self.vx = -self.BASE_STEP if side == GameSide.LEFT else self.BASE_STEP
+        self.vy = 0
+        self.serve_side = None
+
+    def on_paddle(self, paddle: FixedPointPaddle) -> bool:
+        return (
+            abs(self.x - paddle.x) <= self.radius + paddle.half_width and
+            paddle.y - paddle.half_height - self.radius <= self.y <= paddle.y + paddle.half_height + self.radius
+        )
+
+    def bounce_off(self, paddle: FixedPointPaddle, direction: int) -> None:
+        """Send the ball back at an angle depending on where it met the paddle."""
+        self.paddle_hits += 1
+        span = 2 * paddle.half_height
+        offset = min(max(self.y - (paddle.y - paddle.half_height), 0), span)
+        last = len(DIRECTIONS) - 1
+        cos, sin = DIRECTIONS[(offset * last + span // 2) // span]
+        speed = self.BASE_STEP * self.speed_percent() // 100
+        self.vx = direction * speed * cos // DIRECTION_SCALE
+        self.vy = speed * sin // DIRECTION_SCALE
+
+    def speed_percent(self) -> int:
+        """Integer version of calculate_ball_speed, as a percentage of BASE_STEP."""
+        if self.paddle_hits < 5:
+            return 100
+        if self.paddle_hits < 10:
+            return 125
+        if self.paddle_hits < 20:
+            return min(150 + (self.paddle_hits - 10) * 10, 300)
+        return 300
+
+    def handle_scoring(self, side: GameSide, new_score: int) -> None:
+        if side == GameSide.LEFT:
+            self.right_score = new_score
+        else:
+            self.left_score = new_score
+        scorer = GameSide.RIGHT if side == GameSide.LEFT else GameSide.LEFT
+        self.events.append(GoalScored(scorer, self.left_score, self.right_score))
+
+        self.paddle_hits = 0
+        self.vx = self.vy = 0
+        self.reset_paddles()
+        self.wait_steps = self.SCORE_STEPS
+        self.serve_side = side
+        self._check_winner()
+
+    def pending_delay(self) -> float:
+        return self.wait_steps * self.PHYSICS_STEP
+
+    def ball_for(self, side: GameSide) -> Ball:
+        """Float view of the ball for bots, which are not part of the exact simulation."""
+        self.ball.x, self.ball.y = self.x / ONE, self.y / ONE
+        self.ball.angle = self.ball.normalize_angle(math.atan2(self.vy, self.vx))
+        return self.ball
+
+    def snapshot(self) -> GameSnapshot:
+        return GameSnapshot(
+            self.x / ONE,
+            self.y / ONE,
+            self.left_paddle.y_position,
+            self.right_paddle.y_position,
+            self.left_score,
+            self.right_score,
+            self.winner
+        )
+
+    def pack(self) -> bytes:
+        """Exact simulation state, to compare or replay runs."""
+        return FIXED_STATE.pack(
+            self.steps, self.x, self.y, self.vx, self.vy,
+            self.left_paddle.y, self.right_paddle.y,
+            self.left_score, self.right_score
+        )
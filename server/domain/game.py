@@ -1,14 +1,24 @@
+import math
+import time
 from dataclasses import dataclass
 from dataclasses import field
-from scipy import interpolate
-import time
-
-import numpy as np
+from typing import List, NamedTuple
 
 from domain.ball import Ball
 from domain.enums import GameState, GameSide
+from domain.events import GameEvent, GoalScored, PaddleHit, StateChanged
 from domain.paddle import Paddle
-from logger import logger
+
+class GameSnapshot(NamedTuple):
+    """Immutable copy of the broadcast state, handed from the simulation to the network side"""
+    ball_x: float
+    ball_y: float
+    left_paddle_y: float
+    right_paddle_y: float
+    left_score: int
+    right_score: int
+    winner: str | None
+
 
 @dataclass
 class Game:
@@ -19,9 +29,11 @@ class Game:
     GAME_HEIGHT = 1.0  # Normalized game height
     SCORE_DELAY = 1.0  # 1 second delay after scoring
     START_DELAY = 3.0  # 3 second delay at game start
+    PHYSICS_STEP = 1/120  # Fixed simulation step in seconds, independent of the tick rate
+    MAX_BALLS = 16  # Upper bound for multi-ball games
 
     # Speed multiplier constants
-    BASE_SPEED = 1/60 * 1/2
+    BASE_SPEED = 0.5  # Ball speed in screen widths per second
     SPEED_TIER_1 = 1.25  # After 5 hits
     SPEED_TIER_2 = 1.5  # After 10 hits
     SPEED_INCREMENT = 0.1  # Per hit after 10 hits
@@ -40,10 +52,15 @@ class Game:
     score_timer: float = 0
     start_timer: float = 0
     scoring_side: GameSide | None = None
-    paddle_hits: int = 0
+    paddle_hits: int = 0  # Hits in the current rally
+    left_hits: int = 0  # Hits over the whole match
+    right_hits: int = 0
     starting_state: bool = False
+    accumulator: float = 0.0  # Simulation time not yet stepped
+    events: List[GameEvent] = field(default_factory=list)  # Emitted since the room last published them
 
-    def update(self) -> None:
+    def update(self, dt: float = 1/60) -> None:
+        """Advance the simulation by dt seconds in fixed PHYSICS_STEP increments."""
         if self.winner or self.state != GameState.PLAYING or self.player_count < 2:
             return
 
@@ -61,7 +78,16 @@ class Game:
                 self.scoring_side = None
             return
 
-        self.ball.update_position()
+        self.accumulator += dt
+        while self.accumulator >= self.PHYSICS_STEP:
+            self.accumulator -= self.PHYSICS_STEP
+            self.step()
+            if self.scoring_side is not None:
+                self.accumulator = 0.0
+                break
+
+    def step(self) -> None:
+        self.ball.update_position(self.PHYSICS_STEP)
 
         # Check for scoring
         if self.ball.x <= 0:
@@ -85,54 +111,79 @@ class Game:
         ):
             self.handle_paddle_hit(self.right_paddle)
 
+    def snapshot(self) -> GameSnapshot:
+        return GameSnapshot(
+            self.ball.x,
+            self.ball.y,
+            self.left_paddle.y_position,
+            self.right_paddle.y_position,
+            self.left_score,
+            self.right_score,
+            self.winner
+        )
+
+    def pending_delay(self) -> float:
+        """Seconds until the ball is served, 0 while it is in play."""
+        if self.starting_state:
+            return max(self.START_DELAY - (time.time() - self.start_timer), 0.0)
+        if self.scoring_side is not None:
+            return max(self.SCORE_DELAY - (time.time() - self.score_timer), 0.0)
+        return 0.0
+
+    def ball_for(self, side: GameSide) -> Ball:
+        """Ball the paddle on the given side should track."""
+        return self.ball
+
     def determine_ball_towards(self) -> GameSide :
-        if (np.pi / 2 <= self.ball.angle <= 3 * np.pi / 2):
+        if (math.pi / 2 <= self.ball.angle <= 3 * math.pi / 2):
             return GameSide.LEFT
         if (
-            (self.ball.angle <= (np.pi / 2)) or 
-            (self.ball.angle >= (3 * np.pi / 2))
+            (self.ball.angle <= (math.pi / 2)) or 
+            (self.ball.angle >= (3 * math.pi / 2))
         ):
             return GameSide.RIGHT
 
     def calc_angle(self, paddle: Paddle) -> float:
         if self.ball_towards == GameSide.LEFT:
-            angle_min = -np.pi / 3
-            angle_max = np.pi / 3
+            angle_min = -math.pi / 3
+            angle_max = math.pi / 3
         else:
-            angle_min = 4 * np.pi / 3
-            angle_max = 2 * np.pi / 3
-
-        y_values = [paddle.y_min, paddle.y_max]
-        angle_values = [angle_min, angle_max]
-
-        # Scipy interpolation function 
-        f = interpolate.interp1d(y_values, angle_values)
+            angle_min = 4 * math.pi / 3
+            angle_max = 2 * math.pi / 3
 
-        angle_interpolated = f(self.ball.y)
+        # Linear interpolation of the hit position across the paddle span
+        y_min, y_max = paddle.y_min, paddle.y_max
+        t = min(max((self.ball.y - y_min) / (y_max - y_min), 0.0), 1.0)
+        angle_interpolated = angle_min + t * (angle_max - angle_min)
         # normalize the angle to [0, 2*pi]
         angle_interpolated = self.ball.normalize_angle(angle_interpolated)
 
         return angle_interpolated
 
+    def set_state(self, state: GameState) -> None:
+        if state != self.state:
+            self.events.append(StateChanged(self.state, state))
+            self.state = state
+
     def add_player(self) -> None:
         self.player_count += 1
         if self.player_count == 2:
-            self.state = GameState.PLAYING
+            self.set_state(GameState.PLAYING)
             self.starting_state = True
             self.start_timer = time.time()
 
     def remove_player(self) -> None:
         self.player_count -= 1
         if self.player_count < 2 and self.state == GameState.PLAYING:
-            self.state = GameState.PAUSED
+            self.set_state(GameState.PAUSED)
 
     def _check_winner(self) -> None:
         if self.left_score >= self.POINTS_TO_WIN:
             self.winner = "left"
-            self.state = GameState.GAME_OVER
+            self.set_state(GameState.GAME_OVER)
         elif self.right_score >= self.POINTS_TO_WIN:
             self.winner = "right"
-            self.state = GameState.GAME_OVER
+            self.set_state(GameState.GAME_OVER)
 
     def reset_paddles(self) -> None:
         """Reset paddles to center position"""
@@ -142,11 +193,11 @@ class Game:
     def handle_scoring(self, side: GameSide, new_score: int) -> None:
         if side == GameSide.LEFT:
             self.right_score = new_score
-            logger.info(f"Room {self.room_id}: Current score - Left: {self.left_score}, Right: {self.right_score} - RIGHT SCORED!")
+            self.events.append(GoalScored(GameSide.RIGHT, self.left_score, self.right_score))
         else:
             self.left_score = new_score
-            logger.info(f"Room {self.room_id}: Current score - Left: {self.left_score}, Right: {self.right_score} - LEFT SCORED!")
-        
+            self.events.append(GoalScored(GameSide.LEFT, self.left_score, self.right_score))
+
         self.paddle_hits = 0
         self.ball.set_speed(self.BASE_SPEED)
         self.reset_paddles()
@@ -167,5 +218,11 @@ class Game:
 
     def handle_paddle_hit(self, paddle: Paddle) -> None:
         self.paddle_hits += 1
+        if paddle is self.left_paddle:
+            self.left_hits += 1
+            self.events.append(PaddleHit(GameSide.LEFT, self.paddle_hits))
+        else:
+            self.right_hits += 1
+            self.events.append(PaddleHit(GameSide.RIGHT, self.paddle_hits))
         self.ball.set_speed(self.calculate_ball_speed())
         self.ball.angle = self.calc_angle(paddle)
\ No newline at end of file
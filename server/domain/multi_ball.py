@@ -0,0 +1,207 @@
+import math
+import time
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+import numpy as np
+
+from domain.ball import Ball
+from domain.enums import GameState, GameSide
+from domain.events import GoalScored, PaddleHit
+from domain.game import Game
+from domain.paddle import Paddle
+
+BALL_POSITION_DTYPE = np.dtype('>f4')  # Wire format of ball coordinates
+
+
+class MultiBallSnapshot(NamedTuple):
+    """Broadcast state of a multi-ball game, ball positions packed as big-endian float32 x, y pairs"""
+    ball_positions: bytes
+    left_paddle_y: float
+    right_paddle_y: float
+    left_score: int
+    right_score: int
+    winner: str | None
+
+
+@dataclass
+class MultiBallGame(Game):
+    """Game variant with several balls in play at once.
+
+    Balls are stored as one array per attribute, so moving them and checking
+    walls, goals and paddles costs a handful of array operations per step
+    regardless of the number of balls. A ball that leaves the field scores and
+    is served again from the center after SCORE_DELAY, the others keep going.
+    """
+    balls: int = 3
+    x: np.ndarray = field(init=False)
+    y: np.ndarray = field(init=False)
+    vx: np.ndarray = field(init=False)  # Velocity in screen widths per second
+    vy: np.ndarray = field(init=False)
+    hits: np.ndarray = field(init=False)  # Paddle hits per ball since its serve
+    active: np.ndarray = field(init=False)  # Ball is in play
+    serve_at: np.ndarray = field(init=False)  # Time an inactive ball is served
+    serve_left: np.ndarray = field(init=False)  # Direction of the next serve
+
+    def __post_init__(self):
+        if not 1 <= self.balls <= self.MAX_BALLS:
+            raise ValueError(f"Ball count must be between 1 and {self.MAX_BALLS}")
+        self.x = np.full(self.balls, 0.5)
+        self.y = np.full(self.balls, 0.5)
+        self.vx = np.zeros(self.balls)
+        self.vy = np.zeros(self.balls)
+        self.hits = np.zeros(self.balls, dtype=np.int32)
+        self.active = np.zeros(self.balls, dtype=bool)
+        self.serve_at = np.full(self.balls, np.inf)
+        # Alternate the opening serves between both sides
+        self.serve_left = np.arange(self.balls) % 2 == 0
+
+    def update(self, dt: float = 1/60) -> None:
+        if self.winner or self.state != GameState.PLAYING or self.player_count < 2:
+            return
+
+        now = time.time()
+        if self.starting_state:
+            if now - self.start_timer < self.START_DELAY:
+                return
+            self.starting_state = False
+            # Stagger the opening serves so the balls do not travel as a pack
+            self.serve_at = now + np.arange(self.balls) * self.SCORE_DELAY / self.balls
+
+        due = ~self.active & (self.serve_at <= now)
+        if due.any():
+            self.serve(due)
+
+        self.accumulator += dt
+        while self.accumulator >= self.PHYSICS_STEP:
+            self.accumulator -= self.PHYSICS_STEP
+            self.step()
+            if self.winner:
+                break
+
+    def serve(self, balls: np.ndarray) -> None:
+        """Put the selected balls in play from the center at base speed."""
+        self.x[balls] = 0.5
+        self.y[balls] = 0.5
+        self.vx[balls] = np.where(self.serve_left[balls], -self.BASE_SPEED, self.BASE_SPEED)
+        self.vy[balls] = 0.0
+        self.hits[balls] = 0
+        self.active[balls] = True
+        self.serve_at[balls] = np.inf
+
+    def step(self) -> None:
+        radius = self.ball_radius
+        self.x += self.vx * self.PHYSICS_STEP
+        self.y += self.vy * self.PHYSICS_STEP
+
+        # Bounce off top and bottom
+        bounce = ((self.y <= radius) & (self.vy < 0)) | ((self.y >= 1 - radius) & (self.vy > 0))
+        self.vy[bounce] *= -1
+
+        # Check for scoring
+        left_out = self.active & (self.x <= 0)
+        right_out = self.active & (self.x >= self.GAME_WIDTH)
+        if left_out.any() or right_out.any():
+            self.handle_goals(left_out, right_out)
+            if self.winner:
+                return
+
+        # Paddle collisions, only for balls moving towards the paddle
+        left_hit = self.active & (self.vx < 0) & self.on_paddle(self.left_paddle)
+        if left_hit.any():
+            self.bounce_off(self.left_paddle, left_hit, -math.pi / 3, math.pi / 3)
+            self.left_hits += int(left_hit.sum())
+
+        right_hit = self.active & (self.vx > 0) & self.on_paddle(self.right_paddle)
+        if right_hit.any():
+            self.bounce_off(self.right_paddle, right_hit, 4 * math.pi / 3, 2 * math.pi / 3)
+            self.right_hits += int(right_hit.sum())
+
+    @property
+    def ball_radius(self) -> float:
+        return self.ball.radius
+
+    def on_paddle(self, paddle: Paddle) -> np.ndarray:
+        radius = self.ball_radius
+        return (
+            (np.abs(self.x - paddle.x_position) <= radius + paddle.width / 2) &
+            (self.y >= paddle.y_min - radius) &
+            (self.y <= paddle.y_max + radius)
+        )
+
+    def bounce_off(self, paddle: Paddle, hit: np.ndarray, angle_min: float, angle_max: float) -> None:
+        """Send the hit balls back at an angle depending on where they met the paddle."""
+        self.hits[hit] += 1
+        side = GameSide.LEFT if paddle is self.left_paddle else GameSide.RIGHT
+        self.events.extend(PaddleHit(side, int(hits)) for hits in self.hits[hit])
+        speed = self.ball_speeds(self.hits[hit])
+        t = np.clip((self.y[hit] - paddle.y_min) / (paddle.y_max - paddle.y_min), 0.0, 1.0)
+        angle = angle_min + t * (angle_max - angle_min)
+        self.vx[hit] = speed * np.cos(angle)
+        self.vy[hit] = speed * np.sin(angle)
+
+    def ball_speeds(self, hits: np.ndarray) -> np.ndarray:
+        """Vectorized calculate_ball_speed for the given per-ball hit counts."""
+        multiplier = np.select(
+            [hits < 5, hits < 10, hits < 20],
+            [1.0, self.SPEED_TIER_1,
+             np.minimum(self.SPEED_TIER_2 + (hits - 10) * self.SPEED_INCREMENT, self.MAX_SPEED_MULTIPLIER)],
+            self.MAX_SPEED_MULTIPLIER
+        )
+        return self.BASE_SPEED * multiplier
+
+    def handle_goals(self, left_out: np.ndarray, right_out: np.ndarray) -> None:
+        for _ in range(int(left_out.sum())):
+            self.right_score += 1
+            self.events.append(GoalScored(GameSide.RIGHT, self.left_score, self.right_score))
+        for _ in range(int(right_out.sum())):
+            self.left_score += 1
+            self.events.append(GoalScored(GameSide.LEFT, self.left_score, self.right_score))
+
+        out = left_out | right_out
+        self.active[out] = False
+        self.vx[out] = 0.0
+        self.vy[out] = 0.0
+        # Serve towards the side that conceded, like the single ball game
+        self.serve_left[out] = left_out[out]
+        self.serve_at[out] = time.time() + self.SCORE_DELAY
+        self._check_winner()
+
+    def pending_delay(self) -> float:
+        """Seconds until the next ball is served, 0 while any ball is in play."""
+        if self.starting_state:
+            return max(self.START_DELAY - (time.time() - self.start_timer), 0.0)
+        if self.active.any():
+            return 0.0
+        return max(float(self.serve_at.min()) - time.time(), 0.0)
+
+    def ball_for(self, side: GameSide) -> Ball:
+        """Closest ball heading towards the given side, or the closest ball if none is."""
+        incoming = self.vx < 0 if side == GameSide.LEFT else self.vx > 0
+        distance = self.x if side == GameSide.LEFT else 1 - self.x
+        candidates = np.flatnonzero(self.active & incoming)
+        if not len(candidates):
+            candidates = np.flatnonzero(self.active)
+        if not len(candidates):
+            return self.ball
+        i = candidates[np.argmin(distance[candidates])]
+        return Ball(
+            x=float(self.x[i]),
+            y=float(self.y[i]),
+            angle=math.atan2(self.vy[i], self.vx[i]) % (2 * math.pi),
+            speed=math.hypot(self.vx[i], self.vy[i]),
+            radius=self.ball_radius
+        )
+
+    def snapshot(self) -> MultiBallSnapshot:
+        positions = np.empty((int(self.active.sum()), 2), dtype=BALL_POSITION_DTYPE)
+        positions[:, 0] = self.x[self.active]
+        positions[:, 1] = self.y[self.active]
+        return MultiBallSnapshot(
+            positions.tobytes(),
+            self.left_paddle.y_position,
+            self.right_paddle.y_position,
+            self.left_score,
+            self.right_score,
+            self.winner
+        )
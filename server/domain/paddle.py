@@ -1,17 +1,18 @@
 from dataclasses import dataclass
-import numpy as np
+
 from domain.ball import Ball
 
 
 @dataclass
 class Paddle:
     INITIAL_Y = 0.45  # Default center position
+    INPUT_INTERVAL = 1/60  # Clients send one move command per rendered frame
     
     x_position: float # Position as percentage of screen height (0-1)
     y_position: float = INITIAL_Y  # Position as percentage of screen height (0-1)
     height: float = 0.2  # Height as percentage of screen height
     width: float = 0.02 # Width of the paddle
-    speed: float = 0.01  # Movement speed per frame
+    speed: float = 0.6  # Movement speed per second of held input
 
     def __init__(self, x_pos: float):
         self.x_position = x_pos
@@ -26,17 +27,17 @@ class Paddle:
         return self.y_position + self.h
 
     def is_on_paddle(self, ball: Ball) -> bool:
-        if np.abs(ball.x - self.x_position) <= ball.radius + self.width / 2:
+        if abs(ball.x - self.x_position) <= ball.radius + self.width / 2:
             if self.y_min - ball.radius <= ball.y <= self.y_max + ball.radius:
                 return True
         return False
 
-    def move_up(self) -> None:
-        new_y = self.y_position - self.speed
+    def move_up(self, dt: float = INPUT_INTERVAL) -> None:
+        new_y = self.y_position - self.speed * dt
         self.y_position = max(self.h, new_y)
 
-    def move_down(self) -> None:
-        new_y = self.y_position + self.speed 
+    def move_down(self, dt: float = INPUT_INTERVAL) -> None:
+        new_y = self.y_position + self.speed * dt
         self.y_position = min(1.0 - self.h, new_y)
 
     def reset_position(self) -> None:
@@ -1,4 +1,96 @@
+import atexit
+import json
 import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_QUEUE_SIZE = 10_000  # Records beyond this are dropped instead of blocking the game loop
+RATE_LIMIT_WINDOW = 10.0  # Seconds per rate limit window
+RATE_LIMIT_BURST = 5  # Records per message template and window before sampling starts
+RATE_LIMIT_SAMPLE = 100  # Keep one in this many records once sampling
+
+STRUCTURED_FIELDS = ("room", "player", "role")
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line, including room and player fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "msg": record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            entry["suppressed"] = suppressed
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """Rate limit repetitive warnings per message template.
+
+    After RATE_LIMIT_BURST records of a template within a window, only one in
+    RATE_LIMIT_SAMPLE passes, carrying the number of records it stands for.
+    Records still suppressed when a window ends are counted on the first
+    record of the next one. Keys on the unformatted template, so dropped
+    records are never formatted. Called from simulation threads as well.
+    """
+
+    def __init__(self, level: int = logging.WARNING):
+        super().__init__()
+        self.level = level
+        self.windows: dict[str, list] = {}  # template -> [window start, count, suppressed]
+        self.lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno != self.level:
+            return True
+
+        now = time.monotonic()
+        with self.lock:
+            window = self.windows.get(record.msg)
+            if window is None:
+                window = self.windows[record.msg] = [now, 0, 0]
+            elif now - window[0] >= RATE_LIMIT_WINDOW:
+                # New window, the suppressed count carries over
+                window[0] = now
+                window[1] = 0
+
+            window[1] += 1
+            if window[1] <= RATE_LIMIT_BURST or window[1] % RATE_LIMIT_SAMPLE == 0:
+                record.suppressed = window[2]
+                window[2] = 0
+                return True
+
+            window[2] += 1
+            return False
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Hand records to the listener thread without formatting or blocking the caller."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting happens on the listener thread
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
 
 
 def setup_logger():
@@ -12,12 +104,19 @@ def setup_logger():
         log.setLevel(logging.INFO)
 
         console_handler = logging.StreamHandler()
-        formatter = logging.Formatter('%(message)s')
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(JsonFormatter())
+
+        log_queue = queue.Queue(LOG_QUEUE_SIZE)
+        queue_handler = DroppingQueueHandler(log_queue)
+        queue_handler.addFilter(RateLimitFilter())
+
+        listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
 
-        log.addHandler(console_handler)
+        log.addHandler(queue_handler)
         log.propagate = False
 
     return log
 
-logger = setup_logger()
\ No newline at end of file
+logger = setup_logger()
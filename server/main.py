@@ -1,24 +1,56 @@
 import asyncio
+import os
+import signal
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 
+from api.admin import admin
 from api.endpoints import endpoints
 from api.game_socket_handler import handle_game_connection
+from api.raw_game_socket import RAW_GAME_SOCKET, RawGameSocketMiddleware
+from core.bots import DEFAULT_DIFFICULTY
 from core.game_loop import game_loop
+from core.game_room import DEFAULT_PHYSICS, DEFAULT_ROOM_CLASS
+from core.heartbeat import heartbeat_monitor
+from core.results_store import results_store
+from logger import logger
+
+
+async def drain_and_exit():
+    """Drain rooms, then hand the shutdown over to uvicorn."""
+    if game_loop.draining:
+        return
+    await game_loop.drain()
+    os.kill(os.getpid(), signal.SIGINT)
+
+
+def install_drain_handler():
+    """Drain on SIGTERM before uvicorn closes the WebSocket connections."""
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGTERM, lambda: asyncio.create_task(drain_and_exit()))
+    except (NotImplementedError, RuntimeError):
+        logger.warning("Signal handlers unavailable, shutting down without drain")
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
+    results_store.start()
     game_loop_task = asyncio.create_task(game_loop.run())
+    heartbeat_task = asyncio.create_task(heartbeat_monitor.run())
+    install_drain_handler()
     yield
+    await heartbeat_monitor.stop()
     await game_loop.stop()
-    game_loop_task.cancel()
-    try:
-        await game_loop_task
-    except asyncio.CancelledError:
-        pass
+    for task in (heartbeat_task, game_loop_task):
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    await asyncio.to_thread(results_store.stop)
 
 
 app = FastAPI(lifespan=lifespan)
@@ -35,8 +67,11 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if RAW_GAME_SOCKET:
+    app.add_middleware(RawGameSocketMiddleware)
 
 app.include_router(endpoints)
+app.include_router(admin)
 
 
 @app.websocket("/game")
@@ -45,10 +80,19 @@ async def websocket_endpoint(
         player_name: str | None = None,
         room_id: str | None = None,
         player_uuid: str | None = None,
+        opponent: str | None = None,
+        difficulty: str = DEFAULT_DIFFICULTY,
+        room_class: str = DEFAULT_ROOM_CLASS,
+        balls: int = 1,
+        physics: str = DEFAULT_PHYSICS,
+        resume: str | None = None,
 ):
     await websocket.accept()
     try:
-        await handle_game_connection(websocket, player_name, room_id, player_uuid, game_loop)
+        await handle_game_connection(
+            websocket, player_name, room_id, player_uuid, game_loop, opponent, difficulty, room_class, balls, physics,
+            resume
+        )
     except Exception as e:
         try:
             await websocket.close(code=4000, reason=str(e))
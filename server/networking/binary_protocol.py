@@ -1,7 +1,7 @@
 import uuid
-from struct import pack, unpack
+from struct import pack, unpack, unpack_from
 from enum import IntEnum
-from typing import Optional
+from typing import List, Optional
 
 from domain.enums import GameState
 
@@ -15,6 +15,13 @@ class MessageType(IntEnum):
     GAME_STATE = 1
     GAME_STATUS = 2
     GAME_ID = 3
+    RECONNECT = 4
+    PING = 5
+    BATCH = 6
+    GAME_UPDATE = 7
+    MULTI_BALL_STATE = 8
+    SESSION = 9
+    CATCH_UP = 10
 
 class GameUpdateType(IntEnum):
     NEW_GAME = 1
@@ -22,17 +29,19 @@ class GameUpdateType(IntEnum):
     GAME_OVER = 3
     PLAYER_JOINED = 4
 
+STATE_CODES = {
+    GameState.WAITING: 0,
+    GameState.PLAYING: 1,
+    GameState.PAUSED: 2,
+    GameState.GAME_OVER: 3
+}
+
 def encode_game_update(update_type: GameUpdateType, game_id: uuid.UUID,
                        state: GameState, player_count: int,
                        left_score: int = 0, right_score: int = 0,
                        winner: str | None = None) -> bytes:
-    """Encode game updates into binary format."""
-    state_value = {
-        GameState.WAITING: 0,
-        GameState.PLAYING: 1,
-        GameState.PAUSED: 2,
-        GameState.GAME_OVER: 3
-    }[state]
+    """Encode game updates (score changes, joins, game over) into binary format."""
+    state_value = STATE_CODES[state]
 
     winner_code = 0
     if winner == "left":
@@ -40,7 +49,8 @@ def encode_game_update(update_type: GameUpdateType, game_id: uuid.UUID,
     elif winner == "right":
         winner_code = 2
 
-    return pack('!B16sBBBBB',
+    return pack('!BB16sBBBBB',
+                       MessageType.GAME_UPDATE,
                        update_type.value,
                        game_id.bytes,
                        state_value,
@@ -52,10 +62,17 @@ def encode_game_update(update_type: GameUpdateType, game_id: uuid.UUID,
 
 def decode_command(data: bytes) -> CommandType:
     """Decode binary data into a command."""
-    command_value = unpack('!B', data)[0]
+    command_value = unpack_from('!B', data)[0]
     return CommandType(command_value)
 
 
+def decode_heartbeat(data: bytes) -> Optional[int]:
+    """Decode the echoed ping token of a heartbeat command, if present."""
+    if len(data) < 5:
+        return None
+    return unpack_from('!I', data, 1)[0]
+
+
 def encode_game_status(status: str) -> bytes:
     """Encode game status messages.
     Status can be:
@@ -91,10 +108,101 @@ def encode_game_state(ball_x: float, ball_y: float,
                 winner_code)
 
 
+def encode_multi_ball_state(ball_positions: bytes,
+                            left_paddle_y: float, right_paddle_y: float,
+                            left_score: int, right_score: int,
+                            winner: Optional[str] = None) -> bytes:
+    """Encode multi-ball game state into binary format.
+
+    ball_positions holds the balls in play as big-endian float32 x, y pairs
+    and is appended as is after the ball count.
+    """
+    winner_code = 0
+    if winner == "left":
+        winner_code = 1
+    elif winner == "right":
+        winner_code = 2
+
+    return pack('!BffBBBB',
+                MessageType.MULTI_BALL_STATE,
+                left_paddle_y, right_paddle_y,
+                left_score, right_score,
+                winner_code,
+                len(ball_positions) // 8) + ball_positions
+
+
 def encode_game_id(game_id: str) -> bytes:
     """Encode game ID message."""
     game_id_bytes = game_id.encode('utf-8')
     return pack(f'!BB{len(game_id_bytes)}s',
                MessageType.GAME_ID,
                len(game_id_bytes),
-               game_id_bytes)
\ No newline at end of file
+               game_id_bytes)
+
+
+def encode_reconnect(url: str, delay_ms: int = 0) -> bytes:
+    """Encode reconnect instruction sent to clients while the server drains.
+
+    An empty url means reconnecting to the same address, which the load
+    balancer routes to a healthy instance.
+    """
+    url_bytes = url.encode('utf-8')
+    return pack(f'!BHB{len(url_bytes)}s',
+               MessageType.RECONNECT,
+               delay_ms,
+               len(url_bytes),
+               url_bytes)
+
+
+def encode_ping(token: int) -> bytes:
+    """Encode ping message, clients echo the token back in a heartbeat command."""
+    return pack('!BI', MessageType.PING, token)
+
+
+def encode_session(resume_token: str) -> bytes:
+    """Encode the resume token a player passes back to resume their seat."""
+    token_bytes = resume_token.encode('utf-8')
+    return pack(f'!BB{len(token_bytes)}s',
+               MessageType.SESSION,
+               len(token_bytes),
+               token_bytes)
+
+
+def encode_catch_up(state: GameState, player_count: int,
+                    left_score: int, right_score: int,
+                    winner: str | None, delay_ms: int,
+                    state_message: bytes) -> bytes:
+    """Encode the full room state sent to a resuming player.
+
+    delay_ms is the time until the countdown ends or the ball is served, the
+    current game state message is appended as is.
+    """
+    winner_code = 0
+    if winner == "left":
+        winner_code = 1
+    elif winner == "right":
+        winner_code = 2
+
+    return pack('!BBBBBBH',
+                MessageType.CATCH_UP,
+                STATE_CODES[state],
+                player_count,
+                left_score,
+                right_score,
+                winner_code,
+                delay_ms) + state_message
+
+
+def encode_batch(messages: List[bytes]) -> bytes:
+    """Pack several messages into one container frame.
+
+    Each message is prefixed with its uint16 length. A single message is sent
+    as is, without the container overhead.
+    """
+    if len(messages) == 1:
+        return messages[0]
+    parts = [pack('!BB', MessageType.BATCH, len(messages))]
+    for message in messages:
+        parts.append(pack('!H', len(message)))
+        parts.append(message)
+    return b''.join(parts)
@@ -0,0 +1,66 @@
+"""Runtime profiles for serving the app with uvicorn.
+
+A profile selects the event loop, the WebSocket backend and whether
+permessage-deflate is negotiated. Pick one with ``PONG_RUNTIME_PROFILE`` or
+``--profile``; ``python -m benchmarks.runtime_profiles`` compares them.
+"""
+import argparse
+import os
+from dataclasses import dataclass
+from itertools import product
+
+from logger import logger
+
+
+@dataclass(frozen=True)
+class RuntimeProfile:
+    name: str
+    loop: str  # "asyncio" or "uvloop"
+    ws: str  # "websockets" or "wsproto"
+    per_message_deflate: bool
+
+    def uvicorn_options(self) -> dict:
+        return {
+            "loop": self.loop,
+            "ws": self.ws,
+            "ws_per_message_deflate": self.per_message_deflate,
+        }
+
+
+PROFILES = {
+    f"{loop}-{ws}-{'deflate' if deflate else 'raw'}": RuntimeProfile(
+        name=f"{loop}-{ws}-{'deflate' if deflate else 'raw'}",
+        loop=loop,
+        ws=ws,
+        per_message_deflate=deflate
+    )
+    for loop, ws, deflate in product(("asyncio", "uvloop"), ("websockets", "wsproto"), (False, True))
+}
+
+# Same choices as uvicorn's defaults with uvloop installed
+DEFAULT_PROFILE = "uvloop-websockets-deflate"
+
+
+def get_profile(name: str | None = None) -> RuntimeProfile:
+    name = name or os.getenv("PONG_RUNTIME_PROFILE", DEFAULT_PROFILE)
+    if name not in PROFILES:
+        raise ValueError(f"Unknown runtime profile '{name}', expected one of: {', '.join(PROFILES)}")
+    return PROFILES[name]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the pong server with a runtime profile")
+    parser.add_argument("--profile", default=None, help=f"Runtime profile (default: {DEFAULT_PROFILE})")
+    parser.add_argument("--host", default=os.getenv("HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    args = parser.parse_args()
+
+    import uvicorn
+
+    profile = get_profile(args.profile)
+    logger.info("Starting with runtime profile %s", profile.name)
+    uvicorn.run("main:app", host=args.host, port=args.port, **profile.uvicorn_options())
+
+
+if __name__ == "__main__":
+    main()
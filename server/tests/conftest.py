@@ -0,0 +1,27 @@
+import asyncio
+import uuid
+
+import pytest
+
+from core.connection_registry import ConnectionRegistry
+from core.game_room import GameRoom
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.sent.append(data)
+
+
+@pytest.fixture
+def make_room():
+    """Build rooms with two fake connected players, seated left and right."""
+    def make(room_id: str | None = None, **options) -> GameRoom:
+        options.setdefault("frame_export_dir", "")
+        room = GameRoom(room_id or str(uuid.uuid4()), registry=ConnectionRegistry(), **options)
+        for name in ("left", "right"):
+            asyncio.run(room.connect(FakeWebSocket(), name, str(uuid.uuid4())))
+        return room
+    return make
@@ -70,42 +70,59 @@ class PongClient:
             print(f"Error parsing game status: {decode_err}")
             raise
 
+    @staticmethod
+    def split_messages(data: bytes) -> list[bytes]:
+        """Unpack a batch container frame into its messages."""
+        if data[0] != 0x06:  # Batch
+            return [data]
+        messages = []
+        offset = 2
+        for _ in range(data[1]):
+            length = struct.unpack('>H', data[offset:offset + 2])[0]
+            messages.append(data[offset + 2:offset + 2 + length])
+            offset += 2 + length
+        return messages
+
     async def game_loop(self) -> bool:
         try:
             while self.running:
                 if not self.ws:
                     raise RuntimeError(f"WebSocket connection lost in room {self.room_id}")
 
-                data = await self.ws.recv()
-                message_type = data[0]
-
-                if message_type == 0x01:  # Game State
-                    self.game_state = self.parse_game_state(data)
-
-                    # Send paddle movements based on ball position
-                    if self.player == "left":
-                        if self.game_state.ball_y > self.game_state.paddle_left:
-                            await self.ws.send(bytes([0x01]))  # Move UP
-                        elif self.game_state.ball_y < self.game_state.paddle_left:
-                            await self.ws.send(bytes([0x02]))  # Move DOWN
-                    else:  # right player
-                        if self.game_state.ball_y > self.game_state.paddle_right:
-                            await self.ws.send(bytes([0x01]))  # Move UP
-                        elif self.game_state.ball_y < self.game_state.paddle_right:
-                            await self.ws.send(bytes([0x02]))  # Move DOWN
-
-                    if self.game_state.winner is not None:
-                        print(f"Game over in room {self.room_id}! Winner: {'Left' if self.game_state.winner == 1 else 'Right'}")
-                        self.completed = True
-                        self.running = False
-
-                elif message_type == 0x02:  # Game Status
-                    status = self.parse_game_status(data)
-
-                    status_str = str(status)
-                    if "game_over" in status_str:
-                        self.completed = True
-                        self.running = False
+                frame = await self.ws.recv()
+                for data in self.split_messages(frame):
+                    message_type = data[0]
+
+                    if message_type == 0x01:  # Game State
+                        self.game_state = self.parse_game_state(data)
+
+                        # Send paddle movements based on ball position
+                        if self.player == "left":
+                            if self.game_state.ball_y > self.game_state.paddle_left:
+                                await self.ws.send(bytes([0x01]))  # Move UP
+                            elif self.game_state.ball_y < self.game_state.paddle_left:
+                                await self.ws.send(bytes([0x02]))  # Move DOWN
+                        else:  # right player
+                            if self.game_state.ball_y > self.game_state.paddle_right:
+                                await self.ws.send(bytes([0x01]))  # Move UP
+                            elif self.game_state.ball_y < self.game_state.paddle_right:
+                                await self.ws.send(bytes([0x02]))  # Move DOWN
+
+                        if self.game_state.winner is not None:
+                            print(f"Game over in room {self.room_id}! Winner: {'Left' if self.game_state.winner == 1 else 'Right'}")
+                            self.completed = True
+                            self.running = False
+
+                    elif message_type == 0x05:  # Ping
+                        await self.ws.send(bytes([0x00]) + data[1:5])  # Heartbeat echoing the token
+
+                    elif message_type == 0x02:  # Game Status
+                        status = self.parse_game_status(data)
+
+                        status_str = str(status)
+                        if "game_over" in status_str:
+                            self.completed = True
+                            self.running = False
 
                 await asyncio.sleep(0.016)  # ~60fps
 
@@ -0,0 +1,38 @@
+from core.events import EventBus
+from domain.enums import GameSide, GameState
+from domain.events import GoalScored, PaddleHit, PlayerLeft, StateChanged
+
+
+class Room:
+    game_id = "room"
+
+
+def test_bus_delivers_each_type_in_one_batch():
+    bus = EventBus()
+    received = []
+    bus.subscribe(GoalScored, lambda room, events: received.append(("goals", events)))
+    bus.subscribe(PaddleHit, lambda room, events: received.append(("hits", events)))
+    bus.subscribe(PaddleHit, lambda room, events: received.append(("hits again", events)))
+
+    hits = [PaddleHit(GameSide.LEFT, 1), PaddleHit(GameSide.RIGHT, 2)]
+    goal = GoalScored(GameSide.LEFT, 1, 0)
+    change = StateChanged(GameState.PLAYING, GameState.PAUSED)
+    bus.publish(Room(), [hits[0], goal, hits[1], change])
+
+    assert received == [("hits", hits), ("hits again", hits), ("goals", [goal])]
+    assert bus.counts == {"PaddleHit": 2, "GoalScored": 1, "StateChanged": 1}
+
+
+def test_failing_subscriber_does_not_stop_the_others():
+    bus = EventBus()
+    received = []
+
+    def fail(room, events):
+        raise RuntimeError("broken subscriber")
+
+    bus.subscribe(PlayerLeft, fail)
+    bus.subscribe(PlayerLeft, lambda room, events: received.extend(events))
+    left = PlayerLeft("uuid", "Alice", "left")
+    bus.publish(Room(), [left])
+
+    assert received == [left]
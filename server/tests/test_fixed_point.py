@@ -0,0 +1,47 @@
+import random
+
+from domain.fixed_point import FixedPointGame
+
+TICKS = 3000
+
+
+def play(seed: int, inputs_seed: int, ticks: int = TICKS) -> FixedPointGame:
+    """A match with pseudo-random paddle moves between ticks and jittery tick durations."""
+    game = FixedPointGame(seed=seed)
+    game.add_player()
+    game.add_player()
+    rng = random.Random(inputs_seed)
+    for _ in range(ticks):
+        for paddle in (game.left_paddle, game.right_paddle):
+            move = rng.choice([paddle.move_up, paddle.move_down, None])
+            if move:
+                move()
+        game.update(rng.uniform(0.005, 0.05))  # dt does not affect the steps taken
+        if game.winner:
+            break
+    return game
+
+
+def test_same_seed_and_inputs_give_the_same_packed_state():
+    first, second = play(seed=7, inputs_seed=1), play(seed=7, inputs_seed=1)
+    assert first.left_score + first.right_score > 0
+    assert first.pack() == second.pack()
+
+
+def test_different_inputs_diverge():
+    assert play(seed=7, inputs_seed=1).pack() != play(seed=7, inputs_seed=2).pack()
+
+
+def test_replay_from_the_input_log():
+    game = play(seed=3, inputs_seed=5)
+    replayed = FixedPointGame.replay(game.seed, game.inputs, game.steps)
+    assert replayed.pack() == game.pack()
+    assert replayed.inputs == game.inputs
+
+
+def test_start_delay_is_counted_in_steps():
+    game = FixedPointGame(seed=1)
+    game.add_player()
+    game.add_player()
+    assert not game.starting_state
+    assert game.wait_steps == FixedPointGame.START_STEPS
@@ -0,0 +1,89 @@
+import asyncio
+import os
+import uuid
+
+import pytest
+
+from core.frame_export import FrameRing, FrameRingReader, ring_path
+
+
+@pytest.fixture
+def ring(tmp_path):
+    ring = FrameRing(str(tmp_path / "room.ring"), slots=4, slot_size=64)
+    yield ring
+    ring.close()
+
+
+def frames(count: int, start: int = 1):
+    return [f"frame {i}".encode() for i in range(start, start + count)]
+
+
+def test_reader_gets_frames_in_order_across_wraps(ring):
+    reader = FrameRingReader(ring.path)
+    for batch in (frames(3), frames(3, 4), frames(4, 7)):
+        for frame in batch:
+            ring.publish(frame)
+        assert reader.read() == batch
+    assert reader.lagged == 0
+    assert reader.read() == []
+
+
+def test_reader_counts_frames_overwritten_before_it_read_them(ring):
+    reader = FrameRingReader(ring.path)
+    for frame in frames(10):
+        ring.publish(frame)
+
+    assert reader.read() == frames(4, 7)  # The last lap of the ring
+    assert reader.lagged == 6
+
+
+def test_reader_starts_after_the_last_written_frame(ring):
+    ring.publish(b"before")
+    reader = FrameRingReader(ring.path)
+    ring.publish(b"after")
+    assert reader.read() == [b"after"]
+
+
+def test_oversized_frames_are_dropped(ring):
+    reader = FrameRingReader(ring.path)
+    ring.publish(bytes(ring.max_frame + 1))
+    ring.publish(bytes(ring.max_frame))
+    assert ring.frames_dropped == 1
+    assert reader.read() == [bytes(ring.max_frame)]
+
+
+def test_closed_only_after_the_last_frames_are_read(tmp_path):
+    ring = FrameRing(str(tmp_path / "room.ring"), slots=4, slot_size=64)
+    reader = FrameRingReader(ring.path)
+    ring.publish(b"score")
+    assert not reader.closed
+
+    ring.publish(b"game over")
+    ring.close()
+    assert not os.path.exists(ring.path)
+    assert not reader.closed
+
+    assert reader.read() == [b"score", b"game over"]
+    assert reader.closed
+    reader.close()
+
+
+def test_ring_path_stays_in_the_export_directory(tmp_path):
+    room_id = str(uuid.uuid4())
+    assert ring_path(str(tmp_path), room_id) == os.path.join(os.path.realpath(tmp_path), f"{room_id}.ring")
+    for room_id in ("../../x", "/etc/cron.d/x", room_id.upper()):
+        with pytest.raises(ValueError):
+            ring_path(str(tmp_path), room_id)
+
+
+def test_room_exports_its_frames_until_closed(make_room, tmp_path):
+    room = make_room(frame_export_dir=str(tmp_path))
+    reader = FrameRingReader(ring_path(str(tmp_path), room.game_id))
+    asyncio.run(room.flush())
+
+    exported = reader.read()
+    assert exported and exported == room.players[next(iter(room.players))].websocket.sent[-1:]
+    room.close()
+    assert reader.read() == []
+    assert reader.closed
+    reader.close()
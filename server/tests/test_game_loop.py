@@ -0,0 +1,62 @@
+import asyncio
+import random
+import uuid
+
+from core.game_loop import GameLoop
+from domain.enums import GameState
+
+TICKS = 600  # 10 seconds at 60 Hz, past the start delay and a few rallies
+
+
+def scripted_inputs(room, rng: random.Random) -> None:
+    """Queue the same pseudo-random paddle moves on any room given the same generator."""
+    for paddle in (room.game_state.left_paddle, room.game_state.right_paddle):
+        move = rng.choice([paddle.move_up, paddle.move_down, None])
+        if move:
+            room.change_game(move)
+
+
+def test_offloaded_updates_match_inline_updates(make_room):
+    room_id = str(uuid.uuid4())
+    inline = make_room(room_id, physics="fixed")
+    offloaded = make_room(room_id, physics="fixed")
+    game_loop = GameLoop(simulation_workers=2)
+    game_loop.start_executor()
+
+    async def run():
+        inline_inputs, offloaded_inputs = random.Random(1), random.Random(1)
+        for _ in range(TICKS):
+            scripted_inputs(inline, inline_inputs)
+            await inline.update()
+            scripted_inputs(offloaded, offloaded_inputs)
+            await game_loop.update_rooms_offloaded([offloaded])
+
+    try:
+        asyncio.run(run())
+    finally:
+        game_loop.executor.shutdown()
+
+    assert inline.game_state.state == GameState.PLAYING
+    assert inline.game_state.steps > 0
+    assert offloaded.game_state.pack() == inline.game_state.pack()
+    assert offloaded.game_state.inputs == inline.game_state.inputs
+
+
+def test_changes_wait_while_a_worker_owns_the_game(make_room):
+    room = make_room()
+    paddle = room.game_state.left_paddle
+    start = paddle.y_position
+
+    room.simulating = True
+    room.change_game(paddle.move_down)
+    assert paddle.y_position == start
+    assert len(room.pending_changes) == 1
+
+    # Changes after the step keep their order behind the queued ones
+    room.simulating = False
+    room.change_game(paddle.move_up)
+    assert paddle.y_position == start
+
+    asyncio.run(room.begin_update())
+    assert room.pending_changes == []
+    assert paddle.y_position == start
@@ -0,0 +1,74 @@
+import asyncio
+import time
+
+import pytest
+
+from conftest import FakeWebSocket
+from domain.enums import GameState
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Monotonic time the test advances by hand."""
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
+
+
+def playing_room(make_room):
+    room = make_room()
+    room.game_state.state = GameState.PLAYING
+    room.outbox.clear()
+    return room
+
+
+def test_disconnect_clears_the_player_outbox(make_room):
+    room = make_room()
+    player = next(p for p in room.players.values() if p.role == "left")
+    old_websocket = player.websocket
+    player.outbox.append(b"\x03stale game id")
+
+    room.disconnect(old_websocket)
+    assert player.outbox == []
+
+    websocket = FakeWebSocket()
+    asyncio.run(room.connect(websocket, player.name, player.uuid))
+    asyncio.run(room.flush())
+    assert not any(b"stale game id" in frame for frame in websocket.sent)
+    assert old_websocket.sent == []
+
+
+def test_unchanged_state_is_queued_once_then_skipped(make_room, clock):
+    room = playing_room(make_room)
+    room.queue_state()
+    frame = room.outbox[-1]
+
+    room.queue_state()
+    clock[0] += room.STATE_KEEPALIVE / 2
+    room.queue_state()
+    assert room.outbox == [frame]
+    assert (room.state_frames_sent, room.state_frames_skipped) == (1, 2)
+
+
+def test_unchanged_state_is_resent_after_the_keepalive(make_room, clock):
+    room = playing_room(make_room)
+    room.queue_state()
+    clock[0] += room.STATE_KEEPALIVE
+    room.queue_state()
+
+    assert len(room.outbox) == 2
+    assert room.outbox[1] is room.outbox[0] is room.state_frame  # Encoded once
+    assert (room.state_frames_sent, room.state_frames_skipped) == (2, 0)
+
+
+def test_changed_state_is_sent_immediately(make_room, clock):
+    room = playing_room(make_room)
+    room.queue_state()
+    room.game_state.left_score += 1
+    room.queue_state()
+    room.game_state.left_paddle.move_down()
+    room.queue_state()
+
+    assert len(set(room.outbox)) == 3
+    assert room.outbox[-1] == room.encode_state(*room.game_state.snapshot())
+    assert (room.state_frames_sent, room.state_frames_skipped) == (3, 0)
@@ -0,0 +1,94 @@
+import asyncio
+import struct
+import time
+import uuid
+from urllib.parse import urlencode
+
+import pytest
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from api.game_socket_handler import join_game, leave_game
+from api.raw_game_socket import RawGameSocketMiddleware
+from conftest import FakeWebSocket
+from core.connection_registry import connection_registry
+from core.game_loop import GameLoop, game_loop
+from core.heartbeat import ping_token
+from core.sessions import issue_resume_token
+from domain.enums import GameState
+from main import app
+from networking.binary_protocol import CommandType
+
+ORIGIN = "http://localhost:5173"
+
+
+def test_resume_token_for_a_missing_room_joins_it_by_id():
+    game_loop = GameLoop()
+    room_id, player_uuid = str(uuid.uuid4()), str(uuid.uuid4())
+    websocket = FakeWebSocket()
+
+    joined = asyncio.run(join_game(
+        websocket, "Alice", None, player_uuid, game_loop, resume=issue_resume_token(room_id, player_uuid)
+    ))
+
+    assert joined is not None
+    room, player = joined
+    assert room.game_id == room_id
+    assert game_loop.rooms[room_id] is room
+    assert player.uuid == player_uuid and player.connected
+    leave_game(websocket, room, game_loop)
+    assert connection_registry.find_player(player_uuid) is None
+
+
+@pytest.fixture(params=["starlette", "raw"])
+def client(request):
+    """A test client for each way of serving /game, rooms are removed from the shared loop afterwards."""
+    asgi_app = app if request.param == "starlette" else RawGameSocketMiddleware(app)
+    yield TestClient(asgi_app, headers={"origin": ORIGIN})
+    for room_id in list(game_loop.rooms):
+        game_loop.remove_room(room_id)
+
+
+def game_url(**params) -> str:
+    return f"/game?{urlencode(params)}"
+
+
+def wait_until(condition, timeout: float = 2.0) -> None:
+    """The app runs in the client's thread, poll for the effects of a message."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def test_join_move_heartbeat_and_leave(client):
+    room_id, player_uuid = str(uuid.uuid4()), str(uuid.uuid4())
+    with client.websocket_connect(game_url(player_name="Alice", room_id=room_id, player_uuid=player_uuid)) as ws:
+        wait_until(lambda: connection_registry.find_player(player_uuid) is not None)
+        room = game_loop.rooms[room_id]
+        player = room.players[player_uuid]
+        assert player.role == "left" and player.connected
+
+        room.game_state.state = GameState.PLAYING
+        paddle = room.game_state.left_paddle
+        start = paddle.y_position
+        ws.send_bytes(bytes([CommandType.PADDLE_DOWN]))
+        wait_until(lambda: paddle.y_position > start)
+
+        ws.send_bytes(struct.pack("!BI", CommandType.HEARTBEAT, ping_token()))
+        wait_until(lambda: player.rtt is not None)
+
+    wait_until(lambda: not player.connected)
+    assert connection_registry.find_player(player_uuid) is None
+
+
+@pytest.mark.parametrize("params, reason", [
+    ({"player_name": "Alice", "room_id": "../not-a-room"}, "400: Invalid room id"),
+    ({"room_id": str(uuid.uuid4())}, "400: Player name is required"),
+])
+def test_rejected_joins_close_with_the_http_status(client, params, reason):
+    with client.websocket_connect(game_url(player_uuid=str(uuid.uuid4()), **params)) as ws:
+        with pytest.raises(WebSocketDisconnect) as closed:
+            ws.receive_bytes()
+    assert (closed.value.code, closed.value.reason) == (4000, reason)
+    assert not game_loop.rooms
@@ -0,0 +1,38 @@
+import logging
+import types
+
+import logger as logger_module
+from logger import RATE_LIMIT_BURST, RATE_LIMIT_WINDOW, RateLimitFilter
+
+
+def warning(msg: str = "Player %s disconnected during broadcast") -> logging.LogRecord:
+    return logging.makeLogRecord({"msg": msg, "levelno": logging.WARNING, "args": ("A",)})
+
+
+def test_window_rollover_carries_suppressed_count(monkeypatch):
+    clock = types.SimpleNamespace(now=100.0)
+    monkeypatch.setattr(logger_module, "time", types.SimpleNamespace(monotonic=lambda: clock.now))
+    rate_limit = RateLimitFilter()
+
+    passed = [rate_limit.filter(warning()) for _ in range(RATE_LIMIT_BURST + 10)]
+    assert passed == [True] * RATE_LIMIT_BURST + [False] * 10
+
+    clock.now += RATE_LIMIT_WINDOW
+    record = warning()
+    assert rate_limit.filter(record)
+    assert record.suppressed == 10
+
+    record = warning()
+    assert rate_limit.filter(record)
+    assert record.suppressed == 0
+
+
+def test_templates_and_other_levels_are_limited_separately():
+    rate_limit = RateLimitFilter()
+    for _ in range(RATE_LIMIT_BURST):
+        rate_limit.filter(warning())
+
+    assert not rate_limit.filter(warning())
+    assert rate_limit.filter(warning("Connection timeout"))
+    assert rate_limit.filter(logging.makeLogRecord({"msg": "Player %s disconnected during broadcast",
+                                                    "levelno": logging.INFO}))
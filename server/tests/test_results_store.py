@@ -0,0 +1,43 @@
+import time
+
+from core.results_store import MatchResult, ResultsStore
+
+
+def match(room_id: str, left_score: int, right_score: int, ended_at: float) -> MatchResult:
+    return MatchResult(
+        room_id=room_id,
+        left_uuid="alice",
+        left_name="Alice",
+        right_uuid="bob",
+        right_name="Bob",
+        left_score=left_score,
+        right_score=right_score,
+        winner="left" if left_score > right_score else "right",
+        started_at=ended_at - 60,
+        ended_at=ended_at,
+        duration=60.0,
+        left_hits=12,
+        right_hits=9
+    )
+
+
+def test_results_round_trip(tmp_path):
+    store = ResultsStore(str(tmp_path / "results.db"))
+    store.start()
+    now = time.time()
+    first, second = match("room-1", 5, 3, now - 10), match("room-2", 2, 5, now)
+    store.record(first)
+    store.record(second)
+    store.stop()  # Flushes the pending batch
+
+    recent = store.recent_matches(10)
+    assert [row["room_id"] for row in recent] == ["room-2", "room-1"]
+    assert recent[1] == first.__dict__
+
+    stats = store.player_stats("alice")
+    assert stats["matches"] == 2
+    assert stats["wins"] == 1
+    assert stats["points_for"] == 7
+    assert stats["points_against"] == 8
+    assert stats["hits"] == 24
+    assert store.player_stats("carol")["matches"] == 0
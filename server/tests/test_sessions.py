@@ -0,0 +1,43 @@
+import struct
+import uuid
+
+from core.sessions import RESUME_TOKEN_TTL, issue_resume_token, verify_resume_token
+from networking.binary_protocol import STATE_CODES, MessageType
+
+CATCH_UP_HEADER = struct.Struct('!BBBBBBH')
+ROOM_ID = str(uuid.uuid4())
+
+
+def test_token_names_the_room_of_its_player():
+    token = issue_resume_token(ROOM_ID, "alice")
+    assert verify_resume_token(token, "alice") == ROOM_ID
+    assert verify_resume_token(token, "bob") is None
+
+
+def test_tampered_tokens_are_rejected():
+    token = issue_resume_token(ROOM_ID, "alice")
+    room_id, expires, mac = token.split(".")
+    assert verify_resume_token(f"{uuid.uuid4()}.{expires}.{mac}", "alice") is None
+    assert verify_resume_token(f"{room_id}.{int(expires) + 3600}.{mac}", "alice") is None
+    flipped = mac[:-1] + ("Q" if mac.endswith("A") else "A")
+    assert verify_resume_token(f"{room_id}.{expires}.{flipped}", "alice") is None
+    assert verify_resume_token("garbage", "alice") is None
+
+
+def test_tokens_expire():
+    token = issue_resume_token(ROOM_ID, "alice", now=1000)
+    assert verify_resume_token(token, "alice", now=1000 + RESUME_TOKEN_TTL - 1) == ROOM_ID
+    assert verify_resume_token(token, "alice", now=1000 + RESUME_TOKEN_TTL) is None
+
+
+def test_catch_up_frame_carries_the_full_room_state(make_room):
+    room = make_room()
+    room.game_state.left_score, room.game_state.right_score = 3, 2
+    frame = room.catch_up()
+
+    message_type, state, players, left_score, right_score, winner, delay_ms = CATCH_UP_HEADER.unpack_from(frame)
+    assert message_type == MessageType.CATCH_UP
+    assert state == STATE_CODES[room.game_state.state]
+    assert (players, left_score, right_score, winner) == (2, 3, 2, 0)
+    assert 0 < delay_ms <= room.game_state.START_DELAY * 1000  # Serve still pending after the join
+    assert frame[CATCH_UP_HEADER.size:] == room.encode_state(*room.game_state.snapshot())